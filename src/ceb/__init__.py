@@ -1,19 +1,54 @@
 from .base import CebBase
+from .batch import CebBatch, solve_many
+from .cache import CebCache
+from .corpus import CebCorpus
+from .counts import CebCounts
+from .engine import CebEngine
+from .game import CebGame, JEUCLASSIQUE
+from .meet import CebMeet
 from .operation import CebOperation
-from .plaque import CebPlaque, LISTEPLAQUES, PLAQUESUNIQUES, STRPLAQUESUNIQUES
+from .plaque import CebPlaque, CebValeur, LISTEPLAQUES, PLAQUESUNIQUES, STRPLAQUESUNIQUES
+from .progress import CebProgress
+from .pruning import CebPruning, CebRule
 from .search import IntSearch
 from .status import CebStatus
-from .tirage import CebTirage, solve
+from .stop import CebStop
+from .subsets import CebSubsets
+from .targets import CebTarget, CebTargets
+from .tirage import CebTirage, is_solvable, lookup, solve, solve_all_targets, solve_count
+from .transposition import CebTransposition
 
 __all__ = [
     "CebBase",
+    "CebBatch",
+    "CebCache",
+    "CebCorpus",
+    "CebCounts",
+    "CebEngine",
+    "CebGame",
+    "CebMeet",
     "CebOperation",
     "CebPlaque",
+    "CebProgress",
+    "CebPruning",
+    "CebRule",
+    "CebValeur",
     "LISTEPLAQUES",
     "PLAQUESUNIQUES",
     "STRPLAQUESUNIQUES",
+    "JEUCLASSIQUE",
     "CebStatus",
+    "CebStop",
+    "CebSubsets",
+    "CebTarget",
+    "CebTargets",
     "CebTirage",
+    "CebTransposition",
     "solve",
+    "is_solvable",
+    "solve_all_targets",
+    "solve_count",
+    "solve_many",
+    "lookup",
     "IntSearch",
 ]
@@ -1,7 +1,7 @@
 """ classe de base CebBase (Plaque ou Opération) """
 from __future__ import annotations
 
-from typing import List
+from typing import List, Tuple
 
 
 class CebBase:
@@ -9,17 +9,16 @@ class CebBase:
     Classe de base pour les objets CebBase, représentant une plaque ou une opération.
     """
 
+    __slots__ = ("_value",)
+
     _value: int
-    _operations: List[str]
 
     def __init__(self) -> None:
         """
-        Initialise une nouvelle instance de CebBase avec une valeur par défaut de 0
-        et une liste vide d'opérations.
+        Initialise une nouvelle instance de CebBase avec une valeur par défaut de 0.
         """
         super().__init__()
         self._value = 0
-        self._operations = []
 
     @property
     def value(self) -> int:
@@ -54,7 +53,16 @@ class CebBase:
 
         :return : int
         """
-        return len(self._operations)
+        return len(self.operations)
+
+    @property
+    def operands(self) -> Tuple[int, ...]:
+        """
+        Retourne les valeurs des opérandes de l'objet : aucune pour une plaque.
+
+        :return: Le tuple des valeurs des opérandes.
+        """
+        return ()
 
     @property
     def operations(self) -> List[str]:
@@ -63,7 +71,7 @@ class CebBase:
 
         :return : Liste des opérations
         """
-        return self._operations
+        return []
 
     def __repr__(self) -> str:
         """
@@ -72,7 +80,28 @@ class CebBase:
 
         :return: str
         """
-        return ", ".join(self._operations)
+        return ", ".join(self.operations)
+
+    @property
+    def key(self) -> Tuple[str, ...]:
+        """
+        Retourne la clé de l'objet : deux objets égaux ont la même clé.
+
+        :return: Le tuple des opérations.
+        """
+        return tuple(self.operations)
+
+    @property
+    def canonical_key(self) -> Tuple[str, ...]:
+        """
+        Retourne la forme canonique de l'objet : les opérations triées.
+
+        Deux solutions qui effectuent les mêmes opérations dans un ordre différent
+        ont la même forme canonique.
+
+        :return: Le tuple trié des opérations.
+        """
+        return tuple(sorted(self.operations))
 
     def __eq__(self, other: CebBase) -> bool:
         """
@@ -81,7 +110,15 @@ class CebBase:
         :param other: L'autre objet CebBase à comparer.
         :return: bool
         """
-        return self._operations == other.operations
+        return self.operations == other.operations
+
+    def __hash__(self) -> int:
+        """
+        Retourne le hachage de l'objet, calculé sur sa clé.
+
+        :return: int
+        """
+        return hash(self.key)
 
     @property
     def op1(self) -> str:
@@ -90,7 +127,8 @@ class CebBase:
 
         :return: str
         """
-        return self._operations[0] if len(self._operations) > 0 else ""
+        operations = self.operations
+        return operations[0] if len(operations) > 0 else ""
 
     @property
     def op2(self) -> str:
@@ -99,7 +137,8 @@ class CebBase:
 
         :return: str
         """
-        return self._operations[1] if len(self._operations) > 1 else ""
+        operations = self.operations
+        return operations[1] if len(operations) > 1 else ""
 
     @property
     def op3(self) -> str:
@@ -108,7 +147,8 @@ class CebBase:
 
         :return: str
         """
-        return self._operations[2] if len(self._operations) > 2 else ""
+        operations = self.operations
+        return operations[2] if len(operations) > 2 else ""
 
     @property
     def op4(self) -> str:
@@ -117,7 +157,8 @@ class CebBase:
 
         :return: str
         """
-        return self._operations[3] if len(self._operations) > 3 else ""
+        operations = self.operations
+        return operations[3] if len(operations) > 3 else ""
 
     @property
     def op5(self) -> str:
@@ -126,4 +167,5 @@ class CebBase:
 
         :return: str
         """
-        return self._operations[4] if len(self._operations) > 4 else ""
+        operations = self.operations
+        return operations[4] if len(operations) > 4 else ""
@@ -0,0 +1,167 @@
+"""
+Résolution d'un grand nombre de tirages, éventuellement répartie sur plusieurs processus.
+"""
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from time import monotonic
+from typing import Deque, Iterable, Iterator, List, Set, Tuple
+
+from ceb.engine import CebEngine
+from ceb.game import CebGame, JEUCLASSIQUE
+from ceb.tirage import CebTirage
+
+#: Tirage à résoudre : plaques et recherche
+Draw = Tuple[List[int], int]
+
+#: Tirage réutilisé par le processus de calcul
+_tirage: CebTirage | None = None
+
+
+def _solve_chunk(draws: List[Draw], engine: CebEngine | None, timeout: float = 0.0,
+                 game: CebGame = JEUCLASSIQUE) -> List[dict]:
+    """
+    Résout un lot de tirages avec un seul CebTirage par processus, réaffecté à chaque tirage.
+
+    :param draws: Les tirages du lot.
+    :param engine: Le moteur de résolution, None pour celui du jeu.
+    :param timeout: Délai maximal de la résolution de chaque tirage en secondes, 0 pour ne pas limiter.
+    :param game: Les règles du jeu.
+    :return: Les résultats (CebTirage.result), dans l'ordre des tirages.
+    """
+    global _tirage
+    results = []
+    for plaques, search in draws:
+        if _tirage is None or _tirage.game != game:
+            _tirage = CebTirage(game=game)
+        # toujours par assign : un tirage invalide est retourné tel quel, et non remplacé par un tirage aléatoire
+        _tirage.assign(plaques, search)
+        _tirage.solve(engine, timeout=timeout)
+        results.append(_tirage.result)
+    return results
+
+
+class CebBatch:
+    """
+    Résolution par lots d'une suite de tirages.
+
+    Les tirages sont lus au fur et à mesure et transmis par lots de `chunksize` aux processus
+    de calcul ; au plus deux lots par processus sont en cours. Les résultats sont produits
+    dans l'ordre des tirages, ou dans l'ordre de fin de calcul des lots si `ordered` est faux.
+    """
+
+    def __init__(self, engine: CebEngine | None = None, workers: int = 1, chunksize: int = 16,
+                 ordered: bool = True, timeout: float = 0.0, game: CebGame = JEUCLASSIQUE) -> None:
+        """
+        Initialise une résolution par lots.
+
+        :param engine: Le moteur de résolution, None pour celui du jeu (`CebGame.engine`).
+        :param workers: Nombre de processus de calcul, 1 pour résoudre dans le processus courant.
+        :param chunksize: Nombre de tirages transmis à la fois à un processus.
+        :param ordered: Produit les résultats dans l'ordre des tirages si vrai.
+        :param timeout: Délai maximal de la résolution de chaque tirage en secondes, 0 pour ne pas limiter.
+        :param game: Les règles du jeu.
+        """
+        super().__init__()
+        self._engine: CebEngine | None = engine
+        self._workers: int = workers
+        self._chunksize: int = chunksize
+        self._ordered: bool = ordered
+        self._timeout: float = timeout
+        self._game: CebGame = game
+        self._count: int = 0
+        self._elapsed: float = 0.0
+
+    @property
+    def count(self) -> int:
+        """
+        Retourne le nombre de tirages résolus.
+        """
+        return self._count
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Retourne la durée de la résolution en secondes.
+        """
+        return self._elapsed
+
+    @property
+    def throughput(self) -> float:
+        """
+        Retourne le nombre de tirages résolus par seconde.
+        """
+        return self._count / self._elapsed if self._elapsed else 0.0
+
+    def __str__(self) -> str:
+        """
+        Retourne le bilan de la résolution.
+        """
+        return f"{self._count} tirages en {self._elapsed:.2f} s ({self.throughput:.1f} tirages/s)"
+
+    def solve(self, draws: Iterable[Draw]) -> Iterator[dict]:
+        """
+        Résout une suite de tirages.
+
+        :param draws: Les tirages, couples (plaques, recherche).
+        :return: Un itérateur sur les résultats (CebTirage.result).
+        """
+        self._count = 0
+        self._elapsed = 0.0
+        start = monotonic()
+        iterator = iter(draws)
+        chunks = iter(lambda: list(islice(iterator, self._chunksize)), [])
+        results = self._solve_parallel(chunks) if self._workers > 1 else \
+            (_solve_chunk(chunk, self._engine, self._timeout, self._game) for chunk in chunks)
+        for chunk in results:
+            for result in chunk:
+                self._count += 1
+                self._elapsed = monotonic() - start
+                yield result
+
+    def _solve_parallel(self, chunks: Iterator[List[Draw]]) -> Iterator[List[dict]]:
+        """
+        Répartit les lots sur les processus de calcul.
+
+        :param chunks: Les lots de tirages.
+        :return: Un itérateur sur les résultats des lots.
+        """
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            pending: Deque[Future] | Set[Future] = deque() if self._ordered else set()
+            submit = pending.append if self._ordered else pending.add
+            try:
+                for chunk in islice(chunks, 2 * self._workers):
+                    submit(executor.submit(_solve_chunk, chunk, self._engine, self._timeout, self._game))
+                while pending:
+                    if self._ordered:
+                        done = [pending.popleft()]
+                    else:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        pending.difference_update(done)
+                    for future in done:
+                        for chunk in islice(chunks, 1):
+                            submit(executor.submit(_solve_chunk, chunk, self._engine, self._timeout, self._game))
+                        yield future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+
+def solve_many(draws: Iterable[Draw], workers: int = 1, chunksize: int = 16, ordered: bool = True,
+               engine: CebEngine | None = None, timeout: float = 0.0,
+               game: CebGame = JEUCLASSIQUE) -> Iterator[dict]:
+    """
+    Résout une suite de tirages.
+
+    :param draws: Les tirages, couples (plaques, recherche).
+    :param workers: Nombre de processus de calcul.
+    :param chunksize: Nombre de tirages transmis à la fois à un processus.
+    :param ordered: Produit les résultats dans l'ordre des tirages si vrai, sinon dès qu'ils sont calculés.
+    :param engine: Le moteur de résolution, None pour celui du jeu (`CebGame.engine`).
+    :param timeout: Délai maximal de la résolution de chaque tirage en secondes, 0 pour ne pas limiter.
+    :param game: Les règles du jeu.
+    :return: Un itérateur sur les résultats (CebTirage.result).
+    """
+    return CebBatch(engine, workers, chunksize, ordered, timeout, game).solve(draws)
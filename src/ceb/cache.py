@@ -0,0 +1,162 @@
+"""
+Cache des résultats de la résolution du compte.
+"""
+from __future__ import annotations
+
+import shelve
+from typing import Dict, Hashable, List, Sequence, Tuple
+
+from ceb.base import CebBase
+from ceb.operation import CebOperation
+from ceb.plaque import CebValeur
+
+#: Nombre de résultats mémorisés par défaut
+TAILLEMAX: int = 4096
+
+#: Résultat mémorisé : écart et solutions
+Entry = Tuple[int, List[CebBase]]
+
+
+def detach(node: CebBase) -> CebBase:
+    """
+    Retourne une copie d'une expression dont les feuilles sont des CebValeur :
+    la copie ne référence plus les plaques, ni leurs observateurs, et peut être sérialisée.
+
+    :param node: L'expression à copier.
+    """
+    if isinstance(node, CebOperation):
+        # les opérandes sont déjà ordonnés : l'écriture est conservée
+        return CebOperation(detach(node.left), node.opcode, detach(node.right))
+    return CebValeur(node.value)
+
+
+class CebCache:
+    """
+    Mémorise les résultats de `CebTirage.solve` afin de ne pas résoudre plusieurs fois le même tirage.
+
+    Un résultat est identifié par les plaques triées, la recherche, le moteur et le mode
+    de dédoublonnage : un même tirage dont les plaques sont dans un autre ordre partage
+    le résultat. Les résultats d'une résolution interrompue ne sont pas mémorisés.
+
+    Lorsque le cache est plein, le résultat le moins récemment utilisé est oublié.
+    Avec `filename`, les résultats sont également conservés sur disque avec `shelve`,
+    et retrouvés après un redémarrage.
+    """
+
+    def __init__(self, max_size: int = TAILLEMAX, filename: str | None = None) -> None:
+        """
+        Initialise un cache vide.
+
+        :param max_size: Nombre maximal de résultats mémorisés en mémoire.
+        :param filename: Fichier du cache sur disque, None pour un cache en mémoire seulement.
+        """
+        super().__init__()
+        self._max_size: int = max_size
+        self._table: Dict[Hashable, Entry] = {}
+        self._shelf: shelve.Shelf | None = shelve.open(filename) if filename else None
+        self.hits: int = 0
+        self.disk_hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    @property
+    def max_size(self) -> int:
+        """
+        Retourne le nombre maximal de résultats mémorisés en mémoire.
+        """
+        return self._max_size
+
+    def __len__(self) -> int:
+        """
+        Retourne le nombre de résultats mémorisés en mémoire.
+        """
+        return len(self._table)
+
+    def __enter__(self) -> CebCache:
+        """
+        Retourne le cache, fermé à la sortie du bloc `with`.
+        """
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Ferme le fichier du cache sur disque.
+        """
+        self.close()
+
+    def clear(self) -> None:
+        """
+        Vide le cache, y compris sur disque, et remet les compteurs à zéro.
+        """
+        self._table.clear()
+        if self._shelf is not None:
+            self._shelf.clear()
+        self.hits = self.disk_hits = self.misses = self.evictions = 0
+
+    def close(self) -> None:
+        """
+        Ferme le fichier du cache sur disque.
+        """
+        if self._shelf is not None:
+            self._shelf.close()
+            self._shelf = None
+
+    @staticmethod
+    def key(plaques: Sequence[int], search: int, engine: Hashable, canonical: bool) -> Tuple:
+        """
+        Retourne la clé d'un résultat.
+
+        :param plaques: Valeurs des plaques, dans un ordre quelconque.
+        :param search: La valeur recherchée.
+        :param engine: Le moteur de résolution.
+        :param canonical: Le mode de dédoublonnage des solutions.
+        """
+        return tuple(sorted(plaques)), search, str(engine), canonical
+
+    def get(self, key: Tuple) -> Entry | None:
+        """
+        Retourne le résultat mémorisé pour une clé, None s'il est absent.
+
+        :param key: La clé du résultat.
+        """
+        table = self._table
+        entry = table.pop(key, None)
+        if entry is not None:
+            # le résultat redevient le plus récemment utilisé
+            table[key] = entry
+            self.hits += 1
+            return entry
+        if self._shelf is not None:
+            entry = self._shelf.get(repr(key))
+            if entry is not None:
+                self.disk_hits += 1
+                self._store(key, entry)
+                return entry
+        self.misses += 1
+        return None
+
+    def put(self, key: Tuple, ecart: int, solutions: List[CebBase]) -> None:
+        """
+        Mémorise un résultat.
+
+        :param key: La clé du résultat.
+        :param ecart: L'écart des solutions.
+        :param solutions: Les solutions, copiées sans référence aux plaques.
+        """
+        entry = (ecart, [detach(solution) for solution in solutions])
+        self._store(key, entry)
+        if self._shelf is not None:
+            self._shelf[repr(key)] = entry
+
+    def _store(self, key: Tuple, entry: Entry) -> None:
+        """
+        Mémorise un résultat en mémoire, en oubliant le moins récemment utilisé si besoin.
+
+        :param key: La clé du résultat.
+        :param entry: Le résultat.
+        """
+        table = self._table
+        if key not in table and table and len(table) >= self._max_size:
+            del table[next(iter(table))]
+            self.evictions += 1
+        table[key] = entry
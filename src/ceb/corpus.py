@@ -0,0 +1,230 @@
+"""
+Statistiques de tous les tirages d'un jeu, calculées par lots avec reprise après interruption.
+
+Les tirages sont répartis en lots (shards) de taille fixe. Chaque lot terminé est écrit
+dans le répertoire du corpus ; une exécution interrompue reprend aux lots manquants.
+Le fichier de synthèse réunit les statistiques de tous les tirages, dans l'ordre des tirages.
+
+Exécution : ``python -m ceb.corpus corpus --workers 4``
+"""
+from __future__ import annotations
+
+import csv
+import json
+import os
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from ceb.counts import CebCounts
+from ceb.game import CebGame, JEUCLASSIQUE
+
+#: colonnes du fichier de synthèse
+COLUMNS: List[str] = ["plaques", "solvable", "hardest", "hardest_ecart", "hardest_expressions",
+                      "mean_expressions", "mean_rank"]
+
+
+def statistics(plaques: Sequence[int], search_min: int = 100, search_max: int = 999) -> Dict[str, object]:
+    """
+    Calcule les statistiques d'un tirage pour toutes les recherches, en une seule énumération.
+
+    La recherche la plus difficile est celle de plus grand écart, puis de plus petit nombre
+    d'expressions, puis de plus grand rang minimal. Les moyennes portent sur les recherches
+    dont le compte est bon. Les nombres d'expressions sont ceux de CebCounts (arbres
+    d'expressions distincts), et non le `count` de `CebTirage.solve`.
+
+    :param plaques: Valeurs des plaques.
+    :param search_min: La plus petite recherche.
+    :param search_max: La plus grande recherche.
+    :return: Un dictionnaire dont les clés sont COLUMNS.
+    """
+    counts = CebCounts(plaques)
+    solvable = 0
+    total_expressions = 0
+    total_rank = 0
+    hardest: Tuple[int, int, int, int] | None = None
+    for search in range(search_min, search_max + 1):
+        ecart, _, rank, expressions = counts.solve(search)
+        if ecart == 0:
+            solvable += 1
+            total_expressions += expressions
+            total_rank += rank
+        key = (-ecart, expressions, -rank, search)
+        if hardest is None or key < hardest:
+            hardest = key
+    return {
+        "plaques": " ".join(map(str, plaques)),
+        "solvable": solvable,
+        "hardest": hardest[3],
+        "hardest_ecart": -hardest[0],
+        "hardest_expressions": hardest[1],
+        "mean_expressions": round(total_expressions / solvable, 2) if solvable else 0.0,
+        "mean_rank": round(total_rank / solvable, 3) if solvable else 0.0,
+    }
+
+
+def _shard(draws: List[Tuple[int, ...]], search_min: int, search_max: int) -> List[Dict[str, object]]:
+    """
+    Calcule les statistiques d'un lot de tirages dans un processus de calcul.
+
+    :param draws: Les tirages du lot.
+    :param search_min: La plus petite recherche.
+    :param search_max: La plus grande recherche.
+    :return: Les statistiques, dans l'ordre des tirages.
+    """
+    return [statistics(plaques, search_min, search_max) for plaques in draws]
+
+
+class CebCorpus:
+    """
+    Statistiques de tous les tirages d'un jeu, conservées lot par lot dans un répertoire.
+
+    Le fichier `corpus.json` décrit le jeu, la taille des lots et les colonnes : une reprise avec
+    d'autres paramètres est refusée. Chaque lot est écrit dans un fichier temporaire
+    puis renommé, si bien qu'un lot présent sur le disque est toujours complet.
+    """
+
+    MANIFEST: str = "corpus.json"
+    SUMMARY: str = "summary.csv"
+
+    def __init__(self, directory: str, game: CebGame = JEUCLASSIQUE, shard_size: int = 256) -> None:
+        """
+        Ouvre ou crée un corpus.
+
+        :param directory: Le répertoire du corpus, créé s'il n'existe pas.
+        :param game: Les règles du jeu, dont tous les tirages sont examinés.
+        :param shard_size: Nombre de tirages d'un lot.
+        :raises ValueError: Si le répertoire contient un corpus d'autres paramètres.
+        """
+        super().__init__()
+        self._directory: str = directory
+        self._game: CebGame = game
+        self._shard_size: int = shard_size
+        self._draws: List[Tuple[int, ...]] = game.draws()
+        manifest = {"plaques": sorted(game.plaques), "size": game.size, "search_min": game.search_min,
+                    "search_max": game.search_max, "shard_size": shard_size, "draws": len(self._draws),
+                    "columns": COLUMNS}
+        os.makedirs(directory, exist_ok=True)
+        filename = os.path.join(directory, self.MANIFEST)
+        if os.path.exists(filename):
+            with open(filename, encoding="utf-8") as file:
+                if json.load(file) != manifest:
+                    raise ValueError(f"{directory} : corpus d'autres paramètres")
+        else:
+            self._write(filename, lambda file: json.dump(manifest, file, indent=4))
+
+    @property
+    def shards(self) -> int:
+        """
+        Retourne le nombre de lots.
+        """
+        return -(-len(self._draws) // self._shard_size)
+
+    def __len__(self) -> int:
+        """
+        Retourne le nombre de tirages du corpus.
+        """
+        return len(self._draws)
+
+    def _shard_filename(self, index: int) -> str:
+        """
+        Retourne le nom du fichier d'un lot.
+
+        :param index: L'indice du lot.
+        """
+        return os.path.join(self._directory, f"shard-{index:05d}.json")
+
+    @staticmethod
+    def _write(filename: str, write: Callable) -> None:
+        """
+        Écrit un fichier de manière atomique : dans un fichier temporaire, puis renommé.
+
+        :param filename: Le nom du fichier.
+        :param write: La fonction d'écriture, appelée avec le fichier temporaire ouvert.
+        """
+        temporary = filename + ".tmp"
+        with open(temporary, "w", encoding="utf-8", newline="") as file:
+            write(file)
+        os.replace(temporary, filename)
+
+    def pending(self) -> List[int]:
+        """
+        Retourne les indices des lots qui restent à calculer.
+        """
+        return [index for index in range(self.shards) if not os.path.exists(self._shard_filename(index))]
+
+    def run(self, workers: int = 1, callback: Callable[[int, int], None] | None = None) -> int:
+        """
+        Calcule les lots manquants, chaque lot étant écrit dès qu'il est terminé.
+
+        :param workers: Nombre de processus de calcul, 1 pour calculer dans le processus courant.
+        :param callback: Fonction appelée après chaque lot avec le nombre de lots terminés
+            et le nombre total de lots.
+        :return: Le nombre de lots calculés par cette exécution.
+        """
+        pending = self.pending()
+        done = self.shards - len(pending)
+        search_min, search_max = self._game.search_min, self._game.search_max
+
+        def save(index: int, rows: List[Dict[str, object]]) -> None:
+            nonlocal done
+            self._write(self._shard_filename(index), lambda file: json.dump(rows, file))
+            done += 1
+            if callback is not None:
+                callback(done, self.shards)
+
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(_shard, self._slice(index), search_min, search_max): index
+                           for index in pending}
+                for future in as_completed(futures):
+                    save(futures[future], future.result())
+        else:
+            for index in pending:
+                save(index, _shard(self._slice(index), search_min, search_max))
+        return len(pending)
+
+    def _slice(self, index: int) -> List[Tuple[int, ...]]:
+        """
+        Retourne les tirages d'un lot.
+
+        :param index: L'indice du lot.
+        """
+        return self._draws[index * self._shard_size:(index + 1) * self._shard_size]
+
+    def summary(self) -> str:
+        """
+        Écrit le fichier de synthèse, une ligne par tirage dans l'ordre des tirages.
+
+        :return: Le nom du fichier de synthèse.
+        :raises RuntimeError: Si des lots restent à calculer.
+        """
+        pending = self.pending()
+        if pending:
+            raise RuntimeError(f"{len(pending)} lots restent à calculer")
+
+        def write(file) -> None:
+            writer = csv.DictWriter(file, fieldnames=COLUMNS)
+            writer.writeheader()
+            for index in range(self.shards):
+                with open(self._shard_filename(index), encoding="utf-8") as shard:
+                    writer.writerows(json.load(shard))
+
+        filename = os.path.join(self._directory, self.SUMMARY)
+        self._write(filename, write)
+        return filename
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Statistiques de tous les tirages du compte est bon")
+    parser.add_argument("directory", help="Répertoire du corpus")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="Nombre de processus de calcul")
+    parser.add_argument("-s", "--shard-size", type=int, default=256, help="Nombre de tirages d'un lot")
+    parser.add_argument("-n", "--size", type=int, default=6, help="Nombre de plaques d'un tirage")
+    parser.add_argument("--search-min", type=int, default=100, help="Plus petite recherche")
+    parser.add_argument("--search-max", type=int, default=999, help="Plus grande recherche")
+    args = parser.parse_args()
+    corpus = CebCorpus(args.directory, CebGame(size=args.size, search_min=args.search_min,
+                                               search_max=args.search_max), args.shard_size)
+    corpus.run(args.workers, lambda done, total: print(f"\r{done}/{total} lots", end="", flush=True))
+    print(f"\n{len(corpus)} tirages : {corpus.summary()}")
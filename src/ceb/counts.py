@@ -0,0 +1,197 @@
+"""
+Dénombrement des solutions du compte sur les sous-multi-ensembles de plaques, sans les construire.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from itertools import product
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+#: Sous-multi-ensemble de plaques : valeurs triées
+Multiset = Tuple[int, ...]
+
+#: Valeurs atteignables triées et nombre d'expressions de chacune
+Counts = Tuple[np.ndarray, np.ndarray]
+
+
+def submultisets(multiset: Multiset) -> Iterator[Multiset]:
+    """
+    Retourne les sous-multi-ensembles non vides d'un multi-ensemble, chacun une seule fois.
+
+    :param multiset: Les valeurs triées des plaques.
+    """
+    counter = sorted(Counter(multiset).items())
+    for repeats in product(*(range(count + 1) for _, count in counter)):
+        sub = tuple(value for (value, _), repeat in zip(counter, repeats) for _ in range(repeat))
+        if sub:
+            yield sub
+
+
+def difference(multiset: Multiset, sub: Multiset) -> Multiset:
+    """
+    Retourne le multi-ensemble privé des valeurs de `sub`.
+
+    :param multiset: Les valeurs triées des plaques.
+    :param sub: Un sous-multi-ensemble de `multiset`.
+    """
+    rest = Counter(multiset)
+    rest.subtract(sub)
+    return tuple(sorted(rest.elements()))
+
+
+class CebCounts:
+    """
+    Nombre d'expressions pour chaque valeur atteignable d'un tirage.
+
+    Les plaques de même valeur sont indiscernables : les expressions sont dénombrées
+    sur les sous-multi-ensembles de plaques, en combinant deux sous-multi-ensembles
+    complémentaires. Deux opérations de même valeur combinées comptent pour deux
+    écritures, comme dans l'exploration en profondeur. Seuls des entiers sont mémorisés :
+    pour chaque multi-ensemble, un tableau NumPy trié des valeurs et le tableau de leurs
+    nombres d'expressions, combinés par diffusion comme dans CebVectorized.
+
+    Le nombre obtenu est celui des arbres d'expressions distincts, et non celui des solutions
+    de CebTirage, dédoublonnées par écriture : plusieurs arbres peuvent avoir la même écriture
+    (une plaque et un résultat intermédiaire de même valeur, par exemple « 6 - 1 = 5 »,
+    « 25 / 5 = 5 »). Pour 100 75 50 25 10 10 et la recherche 101, 637 expressions donnent
+    580 solutions.
+    """
+
+    def __init__(self, plaques: Sequence[int]) -> None:
+        """
+        Dénombre les expressions de tous les sous-multi-ensembles de plaques.
+
+        :param plaques: Valeurs des plaques.
+        """
+        super().__init__()
+        self._plaques: Multiset = tuple(sorted(plaques))
+        self._counts: Dict[Multiset, Counts] = {}
+        by_rank: Dict[int, List[Counts]] = {}
+        for multiset in sorted(submultisets(self._plaques), key=len):
+            counts = self._counts[multiset] = self._count(multiset)
+            by_rank.setdefault(max(len(multiset) - 1, 1), []).append(counts)
+
+        #: nombre d'expressions de chaque valeur par rang, tous sous-multi-ensembles confondus
+        self._ranks: Dict[int, Counts] = {
+            rank: self._reduce([values for values, _ in counts], [numbers for _, numbers in counts])
+            for rank, counts in sorted(by_rank.items())}
+        self._values: np.ndarray = np.unique(np.concatenate([values for values, _ in self._ranks.values()]))
+        #: nombre total d'expressions et rang minimal de chaque valeur, dans l'ordre de `_values`
+        self._total: np.ndarray = np.zeros(len(self._values), dtype=np.int64)
+        self._rank: np.ndarray = np.zeros(len(self._values), dtype=np.int64)
+        for rank, (values, numbers) in reversed(self._ranks.items()):
+            index = np.searchsorted(self._values, values)
+            self._total[index] += numbers
+            self._rank[index] = rank
+
+    @staticmethod
+    def _reduce(values: List[np.ndarray], numbers: List[np.ndarray]) -> Counts:
+        """
+        Additionne les nombres d'expressions d'une même valeur.
+
+        :param values: Les tableaux de valeurs, avec doublons.
+        :param numbers: Les tableaux des nombres d'expressions correspondants.
+        :return: Un tuple (valeurs triées distinctes, nombres d'expressions).
+        """
+        values = np.concatenate(values)
+        order = np.argsort(values, kind="stable")
+        values = values[order]
+        starts = np.flatnonzero(np.concatenate(([True], values[1:] != values[:-1])))
+        return values[starts], np.add.reduceat(np.concatenate(numbers)[order], starts)
+
+    def _count(self, multiset: Multiset) -> Counts:
+        """
+        Dénombre les expressions utilisant exactement les plaques d'un multi-ensemble.
+
+        :param multiset: Les valeurs triées des plaques.
+        :return: Un tuple (valeurs triées, nombre d'expressions distinctes de chaque valeur).
+        """
+        if len(multiset) == 1:
+            return np.array(multiset, dtype=np.int64), np.ones(1, dtype=np.int64)
+        values: List[np.ndarray] = []
+        numbers: List[np.ndarray] = []
+        for left in submultisets(multiset):
+            right = difference(multiset, left)
+            if not right or left > right:
+                continue
+            a, na = self._counts[left]
+            if left == right:
+                # couples non ordonnés : les valeurs étant triées, a[j] >= a[i]
+                i, j = np.triu_indices(len(a))
+                g, d, number = a[j], a[i], na[i] * na[j]
+            else:
+                b, nb = self._counts[right]
+                g = np.maximum(a[:, np.newaxis], b).ravel()
+                d = np.minimum(a[:, np.newaxis], b).ravel()
+                number = np.outer(na, nb).ravel()
+                if len(left) > 1 and len(right) > 1:
+                    # deux opérations de même valeur s'écrivent dans les deux ordres
+                    number = np.where(g == d, 2 * number, number)
+            different = g != d
+            useful = d > 1
+            exact = useful.copy()
+            exact[useful] = g[useful] % d[useful] == 0
+            values += [g + d, (g - d)[different], (g * d)[useful], g[exact] // d[exact]]
+            numbers += [number, number[different], number[useful], number[exact]]
+        return self._reduce(values, numbers)
+
+    @staticmethod
+    def _index(values: np.ndarray, value: int) -> int:
+        """
+        Retourne l'indice d'une valeur dans un tableau trié, -1 si elle est absente.
+
+        :param values: Les valeurs triées.
+        :param value: La valeur.
+        """
+        index = int(np.searchsorted(values, value))
+        return index if index < len(values) and values[index] == value else -1
+
+    @property
+    def values(self) -> List[int]:
+        """
+        Retourne les valeurs atteignables, triées.
+        """
+        return self._values.tolist()
+
+    def count(self, value: int) -> int:
+        """
+        Retourne le nombre d'expressions valant `value`.
+
+        :param value: La valeur.
+        """
+        index = self._index(self._values, value)
+        return int(self._total[index]) if index >= 0 else 0
+
+    def rank(self, value: int) -> int:
+        """
+        Retourne le rang minimal des solutions valant `value`, 0 si elle n'est pas atteignable.
+
+        :param value: La valeur.
+        """
+        index = self._index(self._values, value)
+        return int(self._rank[index]) if index >= 0 else 0
+
+    def ranks(self, value: int) -> Dict[int, int]:
+        """
+        Retourne le nombre d'expressions valant `value` pour chaque rang, par rang croissant.
+
+        :param value: La valeur.
+        """
+        ranks = {rank: self._index(values, value) for rank, (values, _) in self._ranks.items()}
+        return {rank: int(self._ranks[rank][1][index]) for rank, index in ranks.items() if index >= 0}
+
+    def solve(self, search: int) -> Tuple[int, List[int], int, int]:
+        """
+        Retourne les caractéristiques des solutions les plus proches de la recherche.
+
+        :param search: La valeur recherchée.
+        :return: Un tuple (écart, valeurs trouvées, rang minimal, nombre d'expressions).
+        """
+        index = int(np.searchsorted(self._values, search))
+        candidates = range(max(index - 1, 0), min(index + 1, len(self._values)))
+        ecart = min(abs(int(self._values[i]) - search) for i in candidates)
+        found = [i for i in candidates if abs(int(self._values[i]) - search) == ecart]
+        return (ecart, [int(self._values[i]) for i in found], int(min(self._rank[i] for i in found)),
+                int(sum(self._total[i] for i in found)))
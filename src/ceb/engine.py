@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from enum import Enum, auto
+
+
+class CebEngine(Enum):
+    """
+    Enumération des moteurs de résolution du compte.
+    """
+
+    Pile = auto()
+    """Exploration en profondeur de toutes les combinaisons, à l'aide d'une pile."""
+
+    SousEnsembles = auto()
+    """Programmation dynamique sur les sous-ensembles de plaques."""
+
+    RangMinimal = auto()
+    """Approfondissement itératif : seules les solutions de rang minimal sont retenues."""
+
+    Vectorise = auto()
+    """Programmation dynamique sur les sous-ensembles de plaques, vectorisée avec NumPy."""
+
+    RetourArriere = auto()
+    """Exploration en profondeur par retour arrière, sur un tableau de travail modifié en place."""
+
+    def __str__(self) -> str:
+        """
+        Retourne une représentation en chaîne de caractères du moteur.
+
+        Returns:
+            str: Une chaîne de caractères représentant le moteur.
+        """
+        return {
+            CebEngine.Pile: "Pile",
+            CebEngine.SousEnsembles: "Sous-ensembles",
+            CebEngine.RangMinimal: "Rang minimal",
+            CebEngine.Vectorise: "Vectorisé",
+            CebEngine.RetourArriere: "Retour arrière",
+        }.get(self, "Inconnu")
@@ -0,0 +1,135 @@
+"""
+Définition d'une variante du jeu : plaques disponibles, nombre de plaques et valeurs recherchées.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from itertools import combinations
+from random import randint, sample
+from typing import List, Sequence, Tuple
+
+from ceb.engine import CebEngine
+from ceb.plaque import LISTEPLAQUES
+
+
+class CebGame:
+    """
+    Règles d'une variante du compte, lues par la validation, le tirage aléatoire et les moteurs.
+
+    Le jeu classique tire 6 plaques parmi `LISTEPLAQUES` et une recherche de 100 à 999.
+    Au-delà de 6 plaques, l'exploration en profondeur (`CebEngine.Pile`) devient impraticable :
+    les moteurs par sous-ensembles (`CebEngine.SousEnsembles`, `CebEngine.Vectorise`), qui
+    mémorisent les valeurs atteignables par multi-ensemble de plaques, restent utilisables
+    jusqu'à 8 plaques. Le moteur par défaut (`engine`) en tient compte.
+    """
+
+    #: Nombre maximal de plaques des moteurs en profondeur (Pile, RetourArriere, RangMinimal)
+    DEPTH_MAX: int = 6
+
+    def __init__(self, plaques: Sequence[int] = LISTEPLAQUES, size: int = 6,
+                 search_min: int = 100, search_max: int = 999) -> None:
+        """
+        Initialise une variante du jeu.
+
+        :param plaques: Les plaques disponibles, une valeur pouvant figurer plusieurs fois.
+        :param size: Le nombre de plaques d'un tirage.
+        :param search_min: La plus petite valeur recherchée.
+        :param search_max: La plus grande valeur recherchée.
+        """
+        super().__init__()
+        if not 1 <= size <= len(plaques):
+            raise ValueError(f"Nombre de plaques invalide : {size}")
+        if not 0 < search_min <= search_max:
+            raise ValueError(f"Intervalle de recherche invalide : {search_min} - {search_max}")
+        self._plaques: Tuple[int, ...] = tuple(plaques)
+        self._counter: Counter[int] = Counter(plaques)
+        self._size: int = size
+        self._search_min: int = search_min
+        self._search_max: int = search_max
+
+    @property
+    def plaques(self) -> Tuple[int, ...]:
+        """
+        Retourne les plaques disponibles.
+        """
+        return self._plaques
+
+    @property
+    def size(self) -> int:
+        """
+        Retourne le nombre de plaques d'un tirage.
+        """
+        return self._size
+
+    @property
+    def search_min(self) -> int:
+        """
+        Retourne la plus petite valeur recherchée.
+        """
+        return self._search_min
+
+    @property
+    def search_max(self) -> int:
+        """
+        Retourne la plus grande valeur recherchée.
+        """
+        return self._search_max
+
+    @property
+    def engine(self) -> CebEngine:
+        """
+        Retourne le moteur de résolution par défaut : `CebEngine.Pile` jusqu'à DEPTH_MAX plaques,
+        `CebEngine.SousEnsembles` au-delà.
+        """
+        return CebEngine.Pile if self._size <= self.DEPTH_MAX else CebEngine.SousEnsembles
+
+    def valid(self, plaques: Sequence[int], search: int) -> bool:
+        """
+        Indique si un tirage respecte les règles : nombre de plaques, plaques disponibles
+        en nombre suffisant et recherche dans l'intervalle.
+
+        :param plaques: Les valeurs des plaques.
+        :param search: La valeur recherchée.
+        """
+        if len(plaques) != self._size or not self._search_min <= search <= self._search_max:
+            return False
+        return all(self._counter[value] >= count for value, count in Counter(plaques).items())
+
+    def random(self) -> Tuple[List[int], int]:
+        """
+        Tire au hasard des plaques parmi les plaques disponibles et une recherche.
+
+        :return: Un tuple (plaques, recherche).
+        """
+        return sample(self._plaques, self._size), randint(self._search_min, self._search_max)
+
+    def draws(self) -> List[Tuple[int, ...]]:
+        """
+        Retourne tous les tirages distincts (multi-ensembles triés de plaques), triés.
+        """
+        return sorted(set(combinations(sorted(self._plaques), self._size)))
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Indique si deux variantes ont les mêmes règles.
+        """
+        if not isinstance(other, CebGame):
+            return NotImplemented
+        return (self._counter, self._size, self._search_min, self._search_max) == \
+            (other._counter, other._size, other._search_min, other._search_max)
+
+    def __hash__(self) -> int:
+        """
+        Retourne le hash des règles de la variante.
+        """
+        return hash((tuple(sorted(self._plaques)), self._size, self._search_min, self._search_max))
+
+    def __repr__(self) -> str:
+        """
+        Retourne une représentation de la variante.
+        """
+        return f"CebGame({self._size} plaques, recherche {self._search_min} - {self._search_max})"
+
+
+#: Le jeu classique : 6 plaques parmi LISTEPLAQUES, recherche de 100 à 999
+JEUCLASSIQUE: CebGame = CebGame()
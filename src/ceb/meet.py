@@ -0,0 +1,130 @@
+"""
+Recherche d'une solution exacte par rencontre au milieu.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Sequence, Set, Tuple
+
+from ceb.base import CebBase
+from ceb.operation import CebOperation
+from ceb.plaque import CebValeur
+from ceb.subsets import CebSubsets, combine, operands
+
+
+class CebMeet:
+    """
+    Indique si une valeur est atteignable exactement, et en retourne une expression témoin.
+
+    Pour un sous-ensemble de plaques, chaque partition en deux sous-ensembles complémentaires
+    est examinée : les valeurs du plus petit côté sont calculées et mémorisées dans un ensemble,
+    et pour chacune d'elles, les seules valeurs utiles de l'autre côté (celles qui, combinées,
+    donnent la recherche) sont cherchées, par l'ensemble de ses valeurs s'il compte au plus
+    `SMALL` plaques, récursivement sinon.
+
+    Les valeurs d'un grand sous-ensemble ne sont énumérées que lorsqu'il a déjà été
+    partitionné `SPLITS` fois : sans ce seuil, un tirage dont le compte n'est pas bon
+    ferait explorer récursivement toutes les partitions pour de nombreuses valeurs,
+    plusieurs fois plus lentement que le calcul de toutes les valeurs (CebSubsets).
+    Avec le seuil, la réponse négative coûte au plus de l'ordre de ce calcul.
+    """
+
+    #: Nombre maximal de plaques d'un sous-ensemble dont les valeurs sont calculées d'emblée
+    SMALL: int = 3
+
+    #: Nombre de partitions d'un grand sous-ensemble au-delà duquel ses valeurs sont calculées
+    SPLITS: int = 1
+
+    def __init__(self, plaques: Sequence[int]) -> None:
+        """
+        Initialise la recherche.
+
+        :param plaques: Valeurs des plaques.
+        """
+        super().__init__()
+        self._leaves: List[CebValeur] = [CebValeur(value) for value in plaques]
+        self._full: int = (1 << len(plaques)) - 1
+        self._reach: Dict[int, Set[int]] = {}
+        self._found: Dict[Tuple[int, int], CebBase | None] = {}
+        self._splits: Dict[int, int] = {}
+
+    def reach(self, mask: int) -> Set[int]:
+        """
+        Retourne les valeurs atteignables avec les plaques d'un petit masque, calculées à la première demande.
+
+        :param mask: Le masque du sous-ensemble.
+        """
+        values = self._reach.get(mask)
+        if values is None:
+            if mask & (mask - 1) == 0:
+                values = {self._leaves[mask.bit_length() - 1].value}
+            else:
+                values = set()
+                for sub, other in CebSubsets.splits(mask):
+                    combine(self.reach(sub), self.reach(other), values)
+            self._reach[mask] = values
+        return values
+
+    def find(self, mask: int, value: int) -> CebBase | None:
+        """
+        Retourne une expression utilisant exactement les plaques du masque et valant `value`.
+
+        :param mask: Le masque du sous-ensemble.
+        :param value: La valeur à obtenir.
+        :return: L'expression, None si la valeur n'est pas atteignable.
+        """
+        key = (mask, value)
+        if key in self._found:
+            return self._found[key]
+        found = None
+        if mask & (mask - 1) == 0:
+            leaf = self._leaves[mask.bit_length() - 1]
+            found = leaf if leaf.value == value else None
+        elif not self._enumerated(mask) or value in self.reach(mask):
+            found = self._split(mask, value)
+        self._found[key] = found
+        return found
+
+    def _enumerated(self, mask: int) -> bool:
+        """
+        Indique si les valeurs d'un masque sont (ou doivent être) calculées pour filtrer les recherches :
+        petit masque, valeurs déjà calculées ou masque partitionné plus de `SPLITS` fois.
+
+        :param mask: Le masque du sous-ensemble.
+        """
+        if mask.bit_count() <= self.SMALL or mask in self._reach:
+            return True
+        splits = self._splits[mask] = self._splits.get(mask, 0) + 1
+        return splits > self.SPLITS
+
+    def _split(self, mask: int, value: int) -> CebBase | None:
+        """
+        Cherche une partition du masque dont la combinaison des deux côtés vaut `value`.
+
+        :param mask: Le masque du sous-ensemble.
+        :param value: La valeur à obtenir.
+        :return: L'expression, None si aucune partition ne convient.
+        """
+        for sub, other in CebSubsets.splits(mask):
+            if sub.bit_count() > other.bit_count():
+                sub, other = other, sub
+            known = other.bit_count() <= self.SMALL or other in self._reach
+            for a in self.reach(sub):
+                for b, opcode in operands(a, value):
+                    if known and b not in self.reach(other):
+                        continue
+                    right = self.find(other, b)
+                    if right is not None:
+                        return CebOperation(self.find(sub, a), opcode, right)
+        return None
+
+    def witness(self, search: int) -> CebBase | None:
+        """
+        Retourne une solution exacte de rang minimal, None si le compte n'est pas bon.
+
+        :param search: La valeur recherchée.
+        """
+        for mask in sorted(range(1, self._full + 1), key=int.bit_count):
+            found = self.find(mask, search)
+            if found is not None:
+                return found
+        return None
@@ -3,25 +3,72 @@ Module contenant la classe CebOperation pour représenter une opération.
 """
 from __future__ import annotations
 
+from typing import Dict, List, Tuple
+
 from .base import CebBase
 
+#: Codes des opérations
+MULTIPLICATION: int = 0
+ADDITION: int = 1
+SOUSTRACTION: int = 2
+DIVISION: int = 3
+
+#: Symboles des opérations, indexés par leur code
+OPERATIONS: List[str] = ["x", "+", "-", "/"]
+
+#: Code de l'opération associé à chaque symbole
+OPCODES: Dict[str, int] = {"x": MULTIPLICATION, "+": ADDITION, "-": SOUSTRACTION, "/": DIVISION, ":": DIVISION}
+
+
+def evaluate(g: int, opcode: int, d: int) -> int:
+    """
+    Calcule la valeur d'une opération entre deux valeurs, sans créer d'objet.
+
+    :param g: La plus grande des deux valeurs.
+    :param opcode: Le code de l'opération.
+    :param d: La plus petite des deux valeurs.
+    :return: La valeur de l'opération, 0 si le résultat est inutilisable.
+    """
+    if opcode == ADDITION:
+        return g + d
+    if opcode == SOUSTRACTION:
+        return g - d
+    if opcode == MULTIPLICATION:
+        return g * d if g > 1 and d > 1 else 0
+    if opcode == DIVISION:
+        return g // d if d > 1 and g % d == 0 else 0
+    return 0
+
 
 class CebOperation(CebBase):
     """
     Classe représentant une opération.
 
+    L'opération est stockée sous forme d'arbre : les deux opérandes et le code de l'opération.
+    La liste des opérations n'est construite qu'à la première consultation.
+
     Attributes:
         _value (int): La valeur résultante de l'opération.
-        _operations (list): Liste des opérations effectuées.
+        _left (CebBase): L'opérande de gauche (le plus grand).
+        _right (CebBase): L'opérande de droite.
+        _opcode (int): Le code de l'opération.
+        _operations (list | None): Liste des opérations, construite à la demande.
     """
 
-    def __init__(self, g: CebBase, op: str, d: CebBase):
-        """ 
+    __slots__ = ("_left", "_right", "_opcode", "_operations")
+
+    _left: CebBase
+    _right: CebBase
+    _opcode: int
+    _operations: List[str] | None
+
+    def __init__(self, g: CebBase, op: int | str, d: CebBase):
+        """
         Initialise une nouvelle instance de CebOperation.
 
         Args:
             g (CebBase): Le premier opérande.
-            op (str): L'opération à effectuer.
+            op (int | str): Le code ou le symbole de l'opération à effectuer.
             d (CebBase): Le second opérande.
         e.g.:
             CebOperation(CebPlaque(5), "+", CebPlaque(3))
@@ -30,33 +77,87 @@ class CebOperation(CebBase):
 
             la valeur de l'opération est définie à 0 si le résultat est inutilisable
         """
-        super().__init__()
-        if g.value < d.value:
-            g, d = d, g
-
-        match op:
-            # """
-            # Effectue l'opération spécifiée sur les opérandes.
-            # """
-            case "+":
-                self._value = g.value + d.value
-            case "-":
-                self._value = g.value - d.value
-            case "x":
-                self._value = g.value * d.value if g.value > 1 and d.value > 1 else 0
-            case "/" | ":":
-                self._value = (
-                    g.value // d.value if d.value > 1 and g.value % d.value == 0 else 0
-                )
-            case _:
-                self._value = 0
-        if self._value != 0:
-            """
-            Met à jour la liste des opérations si la valeur résultante n'est pas nulle.
-            """
-            self._operations.clear()
-            if isinstance(g, CebOperation):
-                self._operations.extend(g.operations)
-            if isinstance(d, CebOperation):
-                self.operations.extend(d.operations)
-            self._operations.append(f"{g._value} {op} {d._value} = {self._value}")
+        vg = g._value
+        vd = d._value
+        if vg < vd:
+            g, d, vg, vd = d, g, vd, vg
+        self._left = g
+        self._right = d
+        self._opcode = op if isinstance(op, int) else OPCODES.get(op, -1)
+        self._operations = None
+        self._value = evaluate(vg, self._opcode, vd)
+
+    @property
+    def left(self) -> CebBase:
+        """
+        Retourne l'opérande de gauche.
+        """
+        return self._left
+
+    @property
+    def right(self) -> CebBase:
+        """
+        Retourne l'opérande de droite.
+        """
+        return self._right
+
+    @property
+    def operands(self) -> Tuple[int, int]:
+        """
+        Retourne les valeurs des deux opérandes, sans créer d'objet.
+
+        :return: Le tuple (valeur de gauche, valeur de droite).
+        """
+        return self._left._value, self._right._value
+
+    @property
+    def opcode(self) -> int:
+        """
+        Retourne le code de l'opération.
+        """
+        return self._opcode
+
+    @property
+    def rank(self) -> int:
+        """
+        Retourne le rang de l'opération, calculé sur l'arbre sans construire les chaînes.
+
+        :return : int
+        """
+        if self._value == 0:
+            return 0
+        rank = 1
+        if isinstance(self._left, CebOperation):
+            rank += self._left.rank
+        if isinstance(self._right, CebOperation):
+            rank += self._right.rank
+        return rank
+
+    @property
+    def operations(self) -> List[str]:
+        """
+        Retourne la liste des opérations, construite et mémorisée au premier appel.
+
+        :return : Liste des opérations
+        """
+        if self._operations is None:
+            operations: List[str] = []
+            if self._value != 0:
+                self._render(operations)
+            self._operations = operations
+        return self._operations
+
+    def _render(self, operations: List[str]) -> None:
+        """
+        Ajoute à la liste les opérations de l'arbre : opérande de gauche,
+        opérande de droite puis l'opération elle-même.
+
+        :param operations: La liste à compléter.
+        """
+        for child in (self._left, self._right):
+            if isinstance(child, CebOperation):
+                if child._operations is not None:
+                    operations.extend(child._operations)
+                else:
+                    child._render(operations)
+        operations.append(f"{self._left.value} {OPERATIONS[self._opcode]} {self._right.value} = {self._value}")
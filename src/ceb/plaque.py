@@ -44,9 +44,37 @@ PLAQUESUNIQUES = sorted(set(LISTEPLAQUES))
 STRPLAQUESUNIQUES = list(map(str, PLAQUESUNIQUES))
 
 
-class CebPlaque(CebBase):
+class CebValeur(CebBase):
+    """
+    Valeur d'une plaque, sans notification : feuille des arbres d'opérations du solveur.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, valeur: int = 0):
+        """
+        Initialise une nouvelle instance de CebValeur.
+
+        Args:
+            valeur (int): La valeur de la plaque.
+        """
+        super().__init__()
+        self._value = valeur
+
+    @property
+    @override
+    def operations(self) -> List[str]:
+        """
+        Retourne la liste des opérations de la plaque, réduite à sa valeur.
+        """
+        return [str(self._value)]
+
+
+class CebPlaque(CebValeur):
     """classe définissant une plaque du jeu"""
 
+    __slots__ = ("_event",)
+
     def __init__(self, valeur_initiale: int = 0, observateur: callable=None):
         """
         Initialise une nouvelle instance de CebPlaque.
@@ -55,13 +83,11 @@ class CebPlaque(CebBase):
             valeur_initiale (int): La valeur initiale de la plaque.
             observateur (callable, optional): Une fonction de rappel pour les notifications.
         """
-        super().__init__()
+        super().__init__(valeur_initiale)
         self._event = ObsEvent()
-        self._value = valeur_initiale
 
         if observateur:
             self.event.connect(observateur)
-        self.operations.append(str(valeur_initiale))
 
     # noinspection PyPep8Naming
     @property
@@ -90,5 +116,4 @@ class CebPlaque(CebBase):
             return
         old = self.value
         super().set_value(valeur)
-        self.operations[0] = str(valeur)
         self.event.emit(self, old)
@@ -0,0 +1,66 @@
+"""
+Avancement de la résolution du compte.
+"""
+from __future__ import annotations
+
+
+class CebProgress:
+    """
+    État d'avancement transmis par le signal `CebTirage.progress`.
+    """
+
+    def __init__(self, nodes: int, elapsed: float, ecart: int, count: int) -> None:
+        """
+        Initialise un état d'avancement.
+
+        :param nodes: Nombre d'états explorés.
+        :param elapsed: Durée écoulée depuis le début de la résolution, en secondes.
+        :param ecart: Le meilleur écart courant.
+        :param count: Le nombre de solutions retenues.
+        """
+        super().__init__()
+        self._nodes: int = nodes
+        self._elapsed: float = elapsed
+        self._ecart: int = ecart
+        self._count: int = count
+
+    @property
+    def nodes(self) -> int:
+        """
+        Retourne le nombre d'états explorés.
+        """
+        return self._nodes
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Retourne la durée écoulée depuis le début de la résolution, en secondes.
+        """
+        return self._elapsed
+
+    @property
+    def rate(self) -> float:
+        """
+        Retourne le nombre d'états explorés par seconde.
+        """
+        return self._nodes / self._elapsed if self._elapsed else 0.0
+
+    @property
+    def ecart(self) -> int:
+        """
+        Retourne le meilleur écart courant.
+        """
+        return self._ecart
+
+    @property
+    def count(self) -> int:
+        """
+        Retourne le nombre de solutions retenues.
+        """
+        return self._count
+
+    def __repr__(self) -> str:
+        """
+        Retourne une représentation de l'état d'avancement.
+        """
+        return f"{self._nodes} états, {self.rate:.0f} états/s, écart {self._ecart}, {self._count} solutions"
@@ -0,0 +1,108 @@
+"""
+Règles d'élagage algébrique de l'exploration en profondeur du compte.
+"""
+from __future__ import annotations
+
+from enum import Enum, auto
+from typing import Dict, Iterable
+
+from ceb.operation import CebOperation
+
+
+class CebRule(Enum):
+    """
+    Enumération des règles d'élagage.
+
+    Une opération écartée par une règle donne une valeur déjà atteignable avec moins de plaques :
+    les valeurs trouvées et l'écart sont inchangés, seules des solutions redondantes disparaissent.
+    """
+
+    ResultatOperande = auto()
+    """Le résultat est égal à l'un des opérandes : a - b = b, a / b = b."""
+
+    AnnuleOperation = auto()
+    """Le résultat est égal à un opérande d'un des opérandes : (a + b) - b, (a x b) / b, a - (a - b)."""
+
+    def __str__(self) -> str:
+        """
+        Retourne une représentation en chaîne de caractères de la règle.
+
+        Returns:
+            str: Une chaîne de caractères représentant la règle.
+        """
+        return {
+            CebRule.ResultatOperande: "Résultat égal à un opérande",
+            CebRule.AnnuleOperation: "Opération annulant une opération précédente",
+        }.get(self, "Inconnue")
+
+
+class CebPruning:
+    """
+    Ensemble configurable de règles d'élagage, avec le nombre d'opérations écartées par règle.
+    `CebTirage._explore` teste les règles sur les valeurs (résultat, opérandes et opérandes
+    des opérandes) avant de créer l'opération : une opération écartée ne coûte aucun objet.
+
+    Le profil strict (aucune règle) conserve exactement les solutions actuelles.
+    """
+
+    def __init__(self, rules: Iterable[CebRule] = tuple(CebRule)) -> None:
+        """
+        Initialise un ensemble de règles.
+
+        :param rules: Les règles appliquées, toutes par défaut.
+        """
+        super().__init__()
+        self._rules: frozenset[CebRule] = frozenset(rules)
+        self._operande: bool = CebRule.ResultatOperande in self._rules
+        self._annule: bool = CebRule.AnnuleOperation in self._rules
+        self.rejections: Dict[CebRule, int] = {rule: 0 for rule in self._rules}
+
+    @classmethod
+    def strict(cls) -> CebPruning:
+        """
+        Retourne le profil strict, sans règle : les solutions sont exactement celles de l'exploration complète.
+        """
+        return cls(())
+
+    @property
+    def rules(self) -> frozenset[CebRule]:
+        """
+        Retourne les règles appliquées.
+        """
+        return self._rules
+
+    def clear(self) -> None:
+        """
+        Remet les compteurs à zéro.
+        """
+        self.rejections = {rule: 0 for rule in self._rules}
+
+    def merge(self, rejections: Dict[CebRule, int]) -> None:
+        """
+        Ajoute les compteurs d'une autre exploration, par exemple d'un processus de calcul.
+
+        :param rejections: Le nombre d'opérations écartées par règle.
+        """
+        for rule, count in rejections.items():
+            self.rejections[rule] = self.rejections.get(rule, 0) + count
+
+    def reject(self, operation: CebOperation) -> bool:
+        """
+        Indique si une opération déjà créée doit être écartée, et compte la première règle qui l'écarte.
+
+        :param operation: L'opération, de valeur non nulle.
+        :return: True si l'opération est écartée.
+        """
+        value = operation.value
+        left = operation.left
+        right = operation.right
+        if self._operande and (value == left.value or value == right.value):
+            self.rejections[CebRule.ResultatOperande] += 1
+            return True
+        if self._annule:
+            for operand in (left, right):
+                if isinstance(operand, CebOperation) and (
+                        value == operand.left.value or value == operand.right.value):
+                    self.rejections[CebRule.AnnuleOperation] += 1
+                    return True
+        return False
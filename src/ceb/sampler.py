@@ -0,0 +1,95 @@
+"""
+Génération en masse de tirages aléatoires, reproductibles, avec NumPy.
+"""
+from __future__ import annotations
+
+from typing import Iterator, Tuple
+
+import numpy as np
+
+from ceb.batch import Draw
+from ceb.game import CebGame, JEUCLASSIQUE
+
+
+class CebSampler:
+    """
+    Générateur de tirages valides, par tableaux : une ligne de plaques et une recherche par tirage.
+
+    Par défaut, les plaques sont tirées sans remise parmi les plaques disponibles, comme
+    `CebTirage.random` : les tirages comportant des plaques répétées dans la liste sont
+    plus fréquents. Avec `distinct`, chaque tirage distinct (multi-ensemble de plaques)
+    a la même probabilité. La graine rend la suite des tirages reproductible.
+    """
+
+    #: Nombre de tirages générés à la fois, pour borner la mémoire de travail
+    CHUNK: int = 65536
+
+    def __init__(self, game: CebGame = JEUCLASSIQUE, seed: int | None = None) -> None:
+        """
+        Initialise un générateur.
+
+        :param game: Les règles du jeu.
+        :param seed: La graine, None pour une suite non reproductible.
+        """
+        super().__init__()
+        self._game: CebGame = game
+        self._rng: np.random.Generator = np.random.default_rng(seed)
+        self._pool: np.ndarray = np.array(game.plaques, dtype=np.min_scalar_type(max(game.plaques)))
+        self._search_dtype: np.dtype = np.min_scalar_type(game.search_max)
+        self._draws: np.ndarray | None = None
+
+    @property
+    def game(self) -> CebGame:
+        """
+        Retourne les règles du jeu.
+        """
+        return self._game
+
+    def _chunk(self, n: int, distinct: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Génère un lot d'au plus CHUNK tirages.
+
+        :param n: Le nombre de tirages.
+        :param distinct: Tire uniformément parmi les tirages distincts si vrai.
+        :return: Un tuple (plaques, recherches).
+        """
+        if distinct:
+            if self._draws is None:
+                self._draws = np.array(self._game.draws(), dtype=self._pool.dtype)
+            plaques = self._draws[self._rng.integers(0, len(self._draws), n)]
+        else:
+            # les `size` plus petites de clés aléatoires désignent un sous-ensemble uniforme d'indices
+            keys = self._rng.random((n, len(self._pool)))
+            plaques = self._pool[np.argpartition(keys, self._game.size - 1, axis=1)[:, :self._game.size]]
+        searches = self._rng.integers(self._game.search_min, self._game.search_max + 1, n,
+                                      dtype=self._search_dtype)
+        return plaques, searches
+
+    def sample(self, n: int, distinct: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Génère `n` tirages.
+
+        :param n: Le nombre de tirages.
+        :param distinct: Tire uniformément parmi les tirages distincts si vrai.
+        :return: Un tuple (plaques, recherches) : un tableau de n lignes de `game.size` plaques,
+            du plus petit type entier suffisant, et un tableau de n recherches.
+        """
+        plaques = np.empty((n, self._game.size), dtype=self._pool.dtype)
+        searches = np.empty(n, dtype=self._search_dtype)
+        for start in range(0, n, self.CHUNK):
+            stop = min(start + self.CHUNK, n)
+            plaques[start:stop], searches[start:stop] = self._chunk(stop - start, distinct)
+        return plaques, searches
+
+    def draws(self, n: int, distinct: bool = False) -> Iterator[Draw]:
+        """
+        Génère `n` tirages par lots, sous la forme attendue par `solve_many` et `CebBatch.solve` ;
+        pour une même graine, ce sont les tirages de `sample`.
+
+        :param n: Le nombre de tirages.
+        :param distinct: Tire uniformément parmi les tirages distincts si vrai.
+        :return: Un itérateur sur les couples (plaques, recherche).
+        """
+        for start in range(0, n, self.CHUNK):
+            plaques, searches = self._chunk(min(self.CHUNK, n - start), distinct)
+            yield from zip(plaques.tolist(), searches.tolist())
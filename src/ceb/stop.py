@@ -0,0 +1,107 @@
+"""
+Critère d'arrêt anticipé de la résolution du compte.
+"""
+from __future__ import annotations
+
+from time import monotonic
+
+
+class CebStop:
+    """
+    Critère d'arrêt de l'exploration en profondeur.
+
+    L'exploration s'arrête dès que `solutions` solutions exactes ont été trouvées
+    (1 : première solution exacte), dès que le délai `timeout` est écoulé, ou dès que
+    `cancel` est appelée, par exemple depuis un autre thread.
+    Les meilleures solutions trouvées jusque-là sont conservées.
+    """
+
+    def __init__(self, solutions: int = 0, timeout: float = 0.0, period: int = 1024) -> None:
+        """
+        Initialise un critère d'arrêt.
+
+        :param solutions: Nombre de solutions exactes à trouver, 0 pour ne pas limiter.
+        :param timeout: Délai maximal de la résolution en secondes, 0 pour ne pas limiter.
+        :param period: Nombre de vérifications entre deux lectures de l'horloge.
+        """
+        super().__init__()
+        self._solutions: int = solutions
+        self._timeout: float = timeout
+        self._period: int = period
+        self._deadline: float = 0.0
+        self._calls: int = 0
+        self._cancelled: bool = False
+
+    @property
+    def solutions(self) -> int:
+        """
+        Retourne le nombre de solutions exactes à trouver.
+        """
+        return self._solutions
+
+    @property
+    def timeout(self) -> float:
+        """
+        Retourne le délai maximal de la résolution en secondes.
+        """
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: float) -> None:
+        """
+        Définit le délai maximal de la résolution, pris en compte au prochain démarrage.
+
+        :param value: Le délai en secondes, 0 pour ne pas limiter.
+        """
+        self._timeout = value
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Indique si la résolution a été annulée.
+        """
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """
+        Annule la résolution : l'exploration s'arrête à la prochaine vérification.
+        Un critère annulé le reste, y compris pour les résolutions suivantes.
+        """
+        self._cancelled = True
+
+    def start(self, timeout: float | None = None) -> None:
+        """
+        Démarre le délai de la résolution.
+
+        :param timeout: Délai de cette résolution en secondes, qui remplace `timeout`
+            sans le modifier ; None pour utiliser `timeout`.
+        """
+        if timeout is None:
+            timeout = self._timeout
+        self._deadline = monotonic() + timeout if timeout > 0 else 0.0
+        self._calls = 0
+
+    def reached(self, ecart: int, count: int) -> bool:
+        """
+        Indique si l'exploration doit s'arrêter.
+
+        :param ecart: L'écart des meilleures solutions trouvées.
+        :param count: Le nombre de meilleures solutions trouvées.
+        :return: True si le critère d'arrêt est atteint.
+        """
+        if self._cancelled:
+            return True
+        if self._solutions and ecart == 0 and count >= self._solutions:
+            return True
+        if self._deadline:
+            self._calls += 1
+            if self._calls >= self._period:
+                self._calls = 0
+                return self.expired()
+        return False
+
+    def expired(self) -> bool:
+        """
+        Indique si le délai de la résolution est écoulé.
+        """
+        return bool(self._deadline) and monotonic() >= self._deadline
@@ -0,0 +1,273 @@
+"""
+Résolution du compte par programmation dynamique sur les sous-ensembles de plaques.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, Sequence, Set, Tuple
+
+from ceb.base import CebBase
+from ceb.operation import ADDITION, DIVISION, MULTIPLICATION, SOUSTRACTION, CebOperation, evaluate
+from ceb.plaque import CebValeur
+from ceb.stop import CebStop
+
+
+def combine(left: Set[int], right: Set[int], values: Set[int]) -> None:
+    """
+    Ajoute à `values` toutes les valeurs obtenues en combinant une valeur de `left`
+    et une valeur de `right` avec les règles de CebOperation.
+
+    :param left: Valeurs atteignables du premier sous-ensemble.
+    :param right: Valeurs atteignables du second sous-ensemble.
+    :param values: Ensemble des valeurs à compléter.
+    """
+    add = values.add
+    for a in left:
+        for b in right:
+            g, d = (a, b) if a >= b else (b, a)
+            add(g + d)
+            if g != d:
+                add(g - d)
+            if d > 1:
+                add(g * d)
+                if g % d == 0:
+                    add(g // d)
+
+
+def operands(a: int, value: int) -> Set[Tuple[int, int]]:
+    """
+    Retourne les couples (opérande, code opération) qui, combinés avec `a`, donnent `value`.
+
+    :param a: La valeur connue.
+    :param value: La valeur à obtenir.
+    :return: Ensemble des couples (b, opcode) tels que l'opération entre a et b vaut value,
+        vide si a ou value n'est pas strictement positif (aucune opération ne les produit ni ne les utilise).
+    """
+    if a <= 0 or value <= 0:
+        return set()
+    candidates = {(value - a, ADDITION), (a - value, SOUSTRACTION), (a + value, SOUSTRACTION), (a * value, DIVISION)}
+    if value % a == 0:
+        candidates.add((value // a, MULTIPLICATION))
+    if a % value == 0:
+        candidates.add((a // value, DIVISION))
+    return {(b, opcode) for b, opcode in candidates
+            if b > 0 and evaluate(max(a, b), opcode, min(a, b)) == value}
+
+
+class CebSubsets:
+    """
+    Valeurs atteignables pour chacun des sous-ensembles de plaques.
+
+    Chaque sous-ensemble est représenté par un masque de bits sur les indices des plaques.
+    Les valeurs sont calculées une seule fois par multi-ensemble de plaques, en combinant
+    les valeurs de deux sous-ensembles disjoints. Les expressions ne sont reconstruites
+    que pour les valeurs retenues.
+
+    Le critère d'arrêt (annulation ou délai écoulé) est vérifié entre deux combinaisons
+    de sous-ensembles : les masques restants ne sont pas calculés (aucune valeur atteignable)
+    et `stopped` est vrai. Les sous-masques d'un masque le précédant, les masques déjà
+    calculés restent exacts, et les solutions sont cherchées parmi leurs valeurs.
+    """
+
+    def __init__(self, plaques: Sequence[int], stop: CebStop | None = None) -> None:
+        """
+        Calcule les valeurs atteignables de tous les sous-ensembles de plaques.
+
+        :param plaques: Valeurs des plaques.
+        :param stop: Critère d'arrêt anticipé, déjà démarré : seuls l'annulation et le délai
+            sont pris en compte.
+        """
+        super().__init__()
+        self._leaves: List[CebValeur] = [CebValeur(value) for value in plaques]
+        self._full: int = (1 << len(plaques)) - 1
+        self._expressions: Dict[Tuple[int, int], List[CebBase]] = {}
+        self._stop: CebStop | None = stop
+        self._stopped: bool = False
+        self._reach: List[Set[int]] = self._compute_reach()
+
+    @property
+    def stopped(self) -> bool:
+        """
+        Indique si le calcul des valeurs atteignables ou la reconstruction des solutions
+        a été interrompu par le critère d'arrêt.
+        """
+        return self._stopped
+
+    def _interrupted(self) -> bool:
+        """
+        Indique si le calcul doit s'arrêter : annulation ou délai écoulé.
+        """
+        if not self._stopped and self._stop is not None:
+            self._stopped = self._stop.cancelled or self._stop.expired()
+        return self._stopped
+
+    def _compute_reach(self) -> List[Set[int]]:
+        """
+        Calcule les valeurs atteignables de chaque masque, une seule fois par multi-ensemble.
+
+        :return: La liste des valeurs atteignables, indexée par masque.
+        """
+        reach: List[Set[int]] = [set() for _ in range(self._full + 1)]
+        by_multiset: Dict[Tuple[int, ...], Set[int]] = {}
+        for mask in range(1, self._full + 1):
+            key = self.multiset(mask)
+            values = by_multiset.get(key)
+            if values is None:
+                if len(key) == 1:
+                    values = {key[0]}
+                else:
+                    values = set()
+                    for sub, other in self.splits(mask):
+                        if self._interrupted():
+                            break
+                        combine(reach[sub], reach[other], values)
+                    if self._stopped:
+                        # masque interrompu : ses valeurs sont incomplètes
+                        continue
+                by_multiset[key] = values
+            reach[mask] = values
+        return reach
+
+    def multiset(self, mask: int) -> Tuple[int, ...]:
+        """
+        Retourne les valeurs triées des plaques d'un masque.
+
+        :param mask: Le masque du sous-ensemble.
+        """
+        return tuple(sorted(self._leaves[i].value for i in self.indices(mask)))
+
+    @staticmethod
+    def indices(mask: int) -> Iterator[int]:
+        """
+        Retourne les indices des plaques d'un masque.
+
+        :param mask: Le masque du sous-ensemble.
+        """
+        index = 0
+        while mask:
+            if mask & 1:
+                yield index
+            mask >>= 1
+            index += 1
+
+    @staticmethod
+    def splits(mask: int) -> Iterator[Tuple[int, int]]:
+        """
+        Retourne les partitions d'un masque en deux sous-ensembles disjoints non vides,
+        chaque partition n'étant retournée qu'une fois.
+
+        :param mask: Le masque du sous-ensemble.
+        """
+        sub = (mask - 1) & mask
+        while sub:
+            other = mask ^ sub
+            if sub > other:
+                yield sub, other
+            sub = (sub - 1) & mask
+
+    @property
+    def full(self) -> int:
+        """
+        Retourne le masque de l'ensemble des plaques.
+        """
+        return self._full
+
+    def reach(self, mask: int) -> Set[int]:
+        """
+        Retourne les valeurs atteignables avec les plaques d'un masque.
+
+        :param mask: Le masque du sous-ensemble.
+        """
+        return self._reach[mask]
+
+    def contains(self, mask: int, value: int) -> bool:
+        """
+        Indique si une valeur est atteignable avec les plaques d'un masque.
+
+        :param mask: Le masque du sous-ensemble.
+        :param value: La valeur recherchée.
+        """
+        return value in self._reach[mask]
+
+    def ecart(self, search: int) -> int:
+        """
+        Retourne le plus petit écart entre une valeur atteignable et la recherche.
+
+        Les valeurs à distance croissante de la recherche sont cherchées dans les ensembles
+        de valeurs distincts, sans les parcourir ; l'écart d'une plaque borne la recherche.
+
+        :param search: La valeur recherchée.
+        """
+        distinct = list({id(values): values for values in self._reach[1:]}.values())
+        bound = min(abs(leaf.value - search) for leaf in self._leaves)
+        for diff in range(bound):
+            if any(search - diff in values or search + diff in values for values in distinct):
+                return diff
+        return bound
+
+    def expressions(self, mask: int, value: int) -> List[CebBase]:
+        """
+        Reconstruit toutes les expressions utilisant exactement les plaques du masque
+        et valant `value`.
+
+        Lorsque deux opérations de même valeur sont combinées, les deux ordres
+        d'écriture sont produits, comme le fait l'exploration en profondeur.
+
+        Le critère d'arrêt est vérifié entre deux partitions, une fois des expressions trouvées :
+        les expressions d'une reconstruction interrompue ne sont pas mémorisées.
+
+        :param mask: Le masque du sous-ensemble.
+        :param value: La valeur à obtenir.
+        :return: Liste des expressions.
+        """
+        key = (mask, value)
+        found = self._expressions.get(key)
+        if found is not None:
+            return found
+        found = []
+        if mask & (mask - 1) == 0:
+            leaf = self._leaves[mask.bit_length() - 1]
+            if leaf.value == value:
+                found.append(leaf)
+        else:
+            for sub, other in self.splits(mask):
+                if found and self._interrupted():
+                    break
+                left = self.reach(sub)
+                right = self.reach(other)
+                # les candidats sont cherchés depuis le plus petit des deux ensembles de valeurs
+                candidates = left if len(left) <= len(right) else \
+                    {a for b in right for a, _ in operands(b, value) if a in left}
+                for a in sorted(candidates):
+                    for b, opcode in operands(a, value):
+                        if b not in right:
+                            continue
+                        for left_expression in self.expressions(sub, a):
+                            for right_expression in self.expressions(other, b):
+                                found.append(CebOperation(left_expression, opcode, right_expression))
+                                if a == b and isinstance(left_expression, CebOperation) \
+                                        and isinstance(right_expression, CebOperation):
+                                    found.append(CebOperation(right_expression, opcode, left_expression))
+        if not self._stopped:
+            self._expressions[key] = found
+        return found
+
+    def solve(self, search: int) -> Tuple[int, List[CebBase]]:
+        """
+        Retourne l'écart et les solutions distinctes les plus proches de la recherche.
+
+        Le critère d'arrêt est vérifié entre deux masques, une fois des solutions trouvées :
+        les solutions des masques déjà parcourus sont retournées.
+
+        :param search: La valeur recherchée.
+        :return: Un tuple (écart, solutions).
+        """
+        diff = self.ecart(search)
+        solutions: Dict[Tuple[str, ...], CebBase] = {}
+        for mask in range(1, self._full + 1):
+            if solutions and self._interrupted():
+                break
+            for value in {search - diff, search + diff}:
+                if self.contains(mask, value):
+                    for expression in self.expressions(mask, value):
+                        solutions.setdefault(expression.key, expression)
+        return diff, list(solutions.values())
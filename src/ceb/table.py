@@ -0,0 +1,162 @@
+"""
+Table précalculée des résultats du compte pour tous les tirages et toutes les recherches.
+
+Le fichier est composé d'un en-tête, des tirages (multi-ensembles triés de plaques)
+puis, pour chaque tirage, d'un enregistrement par recherche. Il est lu par projection
+en mémoire : une consultation ne lit que l'enregistrement demandé.
+
+Génération : ``python -m ceb.table ceb.tbl --workers 4``
+"""
+from __future__ import annotations
+
+import struct
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+from ceb.counts import CebCounts
+from ceb.game import CebGame, JEUCLASSIQUE
+from ceb.status import CebStatus
+
+MAGIC = b"CEBT"
+VERSION = 1
+
+#: en-tête : signature, version, nombre de plaques, recherches minimale et maximale, nombre de tirages
+HEADER = struct.Struct("<4sHHHHI")
+
+#: enregistrement d'un couple (tirage, recherche), sans alignement : 7 octets
+RECORD = np.dtype([("ecart", "<u2"), ("rank", "u1"), ("expressions", "<u4")])
+
+EXPRESSIONSMAX = np.iinfo(np.uint32).max
+
+
+def records(plaques: Sequence[int], search_min: int = 100, search_max: int = 999) -> np.ndarray:
+    """
+    Calcule les enregistrements d'un tirage pour toutes les recherches.
+
+    :param plaques: Valeurs des plaques.
+    :param search_min: La plus petite recherche.
+    :param search_max: La plus grande recherche.
+    :return: Un tableau de RECORD indexé par recherche - search_min.
+    """
+    counts = CebCounts(plaques)
+    row = np.zeros(search_max - search_min + 1, dtype=RECORD)
+    for index, search in enumerate(range(search_min, search_max + 1)):
+        ecart, _, rank, expressions = counts.solve(search)
+        row[index] = (ecart, rank, min(expressions, EXPRESSIONSMAX))
+    return row
+
+
+def generate(filename: str, game: CebGame = JEUCLASSIQUE, workers: int = 1, chunksize: int = 16) -> int:
+    """
+    Génère le fichier de la table de tous les tirages (CebGame.draws) et de toutes les recherches d'un jeu.
+
+    :param filename: Le nom du fichier à créer.
+    :param game: Les règles du jeu.
+    :param workers: Nombre de processus de calcul.
+    :param chunksize: Nombre de tirages transmis à la fois à un processus.
+    :return: Le nombre de tirages de la table.
+    :raises ValueError: Si une plaque ou une recherche dépasse la capacité du format.
+    """
+    size, search_min, search_max = game.size, game.search_min, game.search_max
+    if max(game.plaques) > np.iinfo(np.uint8).max or search_max > np.iinfo(np.uint16).max:
+        raise ValueError(f"{game} : plaques ou recherches trop grandes pour la table")
+    liste = game.draws()
+    with open(filename, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, size, search_min, search_max, len(liste)))
+        file.write(np.array(liste, dtype=np.uint8).tobytes())
+        arguments = (liste, [search_min] * len(liste), [search_max] * len(liste))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for row in executor.map(records, *arguments, chunksize=chunksize):
+                    file.write(row.tobytes())
+        else:
+            for row in map(records, *arguments):
+                file.write(row.tobytes())
+    return len(liste)
+
+
+class CebTable:
+    """
+    Table précalculée, projetée en mémoire : écart, rang minimal et nombre d'expressions
+    de chaque couple (tirage, recherche), consultés en temps constant.
+
+    Le nombre d'expressions est celui de CebCounts : le nombre d'arbres d'expressions
+    distincts, et non le `count` de `CebTirage.solve`, qui compte les écritures distinctes.
+    """
+
+    def __init__(self, filename: str) -> None:
+        """
+        Ouvre un fichier de table.
+
+        :param filename: Le nom du fichier, créé par generate().
+        :raises ValueError: Si le fichier n'est pas une table.
+        """
+        super().__init__()
+        with open(filename, "rb") as file:
+            magic, version, size, search_min, search_max, number = HEADER.unpack(file.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{filename} : table invalide")
+        self._size: int = size
+        self._search_min: int = search_min
+        self._search_max: int = search_max
+        self._draws = np.memmap(filename, dtype=np.uint8, mode="r", offset=HEADER.size, shape=(number, size))
+        self._records = np.memmap(filename, dtype=RECORD, mode="r", offset=HEADER.size + number * size,
+                                  shape=(number, search_max - search_min + 1))
+        self._index: Dict[Tuple[int, ...], int] = {tuple(row): i for i, row in enumerate(self._draws.tolist())}
+
+    def __len__(self) -> int:
+        """
+        Retourne le nombre de tirages de la table.
+        """
+        return len(self._index)
+
+    @property
+    def size(self) -> int:
+        """
+        Retourne le nombre de plaques d'un tirage.
+        """
+        return self._size
+
+    @property
+    def search_min(self) -> int:
+        """
+        Retourne la plus petite recherche de la table.
+        """
+        return self._search_min
+
+    @property
+    def search_max(self) -> int:
+        """
+        Retourne la plus grande recherche de la table.
+        """
+        return self._search_max
+
+    def lookup(self, plaques: Sequence[int], search: int) -> Tuple[CebStatus, int, int, int]:
+        """
+        Consulte la table.
+
+        :param plaques: Valeurs des plaques, dans un ordre quelconque.
+        :param search: La valeur recherchée.
+        :return: Un tuple (statut, écart, rang minimal, nombre d'expressions), le statut
+            étant CebStatus.Invalide si le couple ne figure pas dans la table.
+        """
+        index = self._index.get(tuple(sorted(plaques)))
+        if index is None or not self._search_min <= search <= self._search_max:
+            return CebStatus.Invalide, 0, 0, 0
+        ecart, rank, expressions = self._records[index, search - self._search_min].item()
+        return CebStatus.CompteEstBon if ecart == 0 else CebStatus.CompteApproche, ecart, rank, expressions
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Génération de la table précalculée du compte est bon")
+    parser.add_argument("filename", help="Fichier de la table")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="Nombre de processus de calcul")
+    parser.add_argument("-n", "--size", type=int, default=6, help="Nombre de plaques d'un tirage")
+    parser.add_argument("--search-min", type=int, default=100, help="Plus petite recherche")
+    parser.add_argument("--search-max", type=int, default=999, help="Plus grande recherche")
+    args = parser.parse_args()
+    game = CebGame(size=args.size, search_min=args.search_min, search_max=args.search_max)
+    print(f"{generate(args.filename, game, workers=args.workers)} tirages")
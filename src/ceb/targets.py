@@ -0,0 +1,184 @@
+"""
+Résolution du compte pour toutes les recherches d'un tirage, en une seule énumération.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from ceb.base import CebBase
+from ceb.status import CebStatus
+from ceb.subsets import CebSubsets
+
+
+class CebTarget:
+    """
+    Résultat d'une recherche : valeurs les plus proches, écart et rang minimal,
+    les solutions n'étant reconstruites qu'à la première consultation.
+    """
+
+    def __init__(self, subsets: CebSubsets, search: int, found: List[int], ecart: int, rank: int) -> None:
+        """
+        Initialise le résultat d'une recherche.
+
+        :param subsets: Les valeurs atteignables des sous-ensembles de plaques.
+        :param search: La valeur recherchée.
+        :param found: Les valeurs atteignables les plus proches de la recherche.
+        :param ecart: L'écart entre ces valeurs et la recherche.
+        :param rank: Le rang minimal des solutions.
+        """
+        super().__init__()
+        self._subsets: CebSubsets = subsets
+        self._search: int = search
+        self._found: List[int] = found
+        self._ecart: int = ecart
+        self._rank: int = rank
+        self._solutions: List[CebBase] | None = None
+
+    @property
+    def search(self) -> int:
+        """
+        Retourne la valeur recherchée.
+        """
+        return self._search
+
+    @property
+    def found(self) -> List[int]:
+        """
+        Retourne les valeurs les plus proches de la recherche, triées.
+        """
+        return self._found
+
+    @property
+    def ecart(self) -> int:
+        """
+        Retourne l'écart entre les valeurs trouvées et la recherche.
+        """
+        return self._ecart
+
+    @property
+    def rank(self) -> int:
+        """
+        Retourne le rang minimal des solutions.
+        """
+        return self._rank
+
+    @property
+    def status(self) -> CebStatus:
+        """
+        Retourne le statut de la recherche.
+        """
+        return CebStatus.CompteEstBon if self._ecart == 0 else CebStatus.CompteApproche
+
+    @property
+    def solutions(self) -> List[CebBase]:
+        """
+        Retourne les solutions distinctes, triées par rang, reconstruites à la première consultation.
+        """
+        if self._solutions is None:
+            solutions: Dict[Tuple[str, ...], CebBase] = {}
+            for mask in range(1, self._subsets.full + 1):
+                for value in self._found:
+                    if self._subsets.contains(mask, value):
+                        for expression in self._subsets.expressions(mask, value):
+                            solutions.setdefault(expression.key, expression)
+            self._solutions = sorted(solutions.values(), key=lambda sol: sol.rank)
+        return self._solutions
+
+    @property
+    def count(self) -> int:
+        """
+        Retourne le nombre de solutions.
+        """
+        return len(self.solutions)
+
+
+class CebTargets:
+    """
+    Index des résultats d'un tirage pour toutes les recherches comprises entre
+    `search_min` et `search_max`.
+
+    Les valeurs atteignables sont calculées une seule fois par CebSubsets ; chaque recherche
+    est ensuite résolue par dichotomie dans les valeurs triées.
+    """
+
+    def __init__(self, plaques: Sequence[int], search_min: int = 100, search_max: int = 999) -> None:
+        """
+        Calcule les valeurs atteignables du tirage et leur rang minimal.
+
+        :param plaques: Valeurs des plaques.
+        :param search_min: La plus petite recherche.
+        :param search_max: La plus grande recherche.
+        """
+        super().__init__()
+        self._subsets: CebSubsets = CebSubsets(plaques)
+        self._search_min: int = search_min
+        self._search_max: int = search_max
+        self._ranks: Dict[int, int] = {}
+        for mask in range(1, self._subsets.full + 1):
+            rank = max(mask.bit_count() - 1, 1)
+            for value in self._subsets.reach(mask):
+                if rank < self._ranks.get(value, len(plaques)):
+                    self._ranks[value] = rank
+        self._values: List[int] = sorted(self._ranks)
+        self._targets: Dict[int, CebTarget] = {}
+
+    @property
+    def search_min(self) -> int:
+        """
+        Retourne la plus petite recherche.
+        """
+        return self._search_min
+
+    @property
+    def search_max(self) -> int:
+        """
+        Retourne la plus grande recherche.
+        """
+        return self._search_max
+
+    @property
+    def values(self) -> List[int]:
+        """
+        Retourne toutes les valeurs atteignables du tirage, triées.
+        """
+        return self._values
+
+    @property
+    def exact(self) -> List[int]:
+        """
+        Retourne les recherches pour lesquelles le compte est bon.
+        """
+        return self._values[bisect_left(self._values, self._search_min):
+                            bisect_left(self._values, self._search_max + 1)]
+
+    def __len__(self) -> int:
+        """
+        Retourne le nombre de recherches.
+        """
+        return self._search_max - self._search_min + 1
+
+    def __iter__(self) -> Iterator[CebTarget]:
+        """
+        Retourne les résultats de toutes les recherches, par valeur croissante.
+        """
+        return (self[search] for search in range(self._search_min, self._search_max + 1))
+
+    def __getitem__(self, search: int) -> CebTarget:
+        """
+        Retourne le résultat d'une recherche.
+
+        :param search: La valeur recherchée.
+        :raises KeyError: Si la recherche n'est pas comprise entre `search_min` et `search_max`.
+        """
+        target = self._targets.get(search)
+        if target is None:
+            if not self._search_min <= search <= self._search_max:
+                raise KeyError(search)
+            index = bisect_left(self._values, search)
+            candidates = self._values[max(index - 1, 0):index + 1]
+            ecart = min(abs(value - search) for value in candidates)
+            found = [value for value in candidates if abs(value - search) == ecart]
+            target = self._targets[search] = CebTarget(
+                self._subsets, search, found, ecart, min(self._ranks[value] for value in found))
+        return target
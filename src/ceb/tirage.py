@@ -8,16 +8,35 @@ import csv
 import json
 import os
 import pickle
+import threading
 import xml.etree.ElementTree as XML
-from random import randint
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
 from sys import maxsize
-from typing import List
+from time import monotonic
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterator, List, Tuple
 
 from ceb.base import CebBase
-from ceb.operation import CebOperation
-from ceb.plaque import CebPlaque, LISTEPLAQUES
+from ceb.cache import CebCache
+from ceb.counts import CebCounts
+from ceb.engine import CebEngine
+from ceb.game import CebGame, JEUCLASSIQUE
+from ceb.meet import CebMeet
+from ceb.operation import ADDITION, DIVISION, MULTIPLICATION, SOUSTRACTION, CebOperation, OPERATIONS, evaluate
+from ceb.plaque import CebPlaque, CebValeur
+from ceb.progress import CebProgress
+from ceb.pruning import CebPruning, CebRule
 from ceb.search import IntSearch
 from ceb.status import CebStatus
+from ceb.stop import CebStop
+from ceb.subsets import CebSubsets
+from ceb.targets import CebTargets
+from ceb.transposition import CebTransposition
+from utils import ObsEvent
+
+if TYPE_CHECKING:
+    from ceb.table import CebTable
 
 EXTENSION_METHODS = {
     ".json": "save_to_json",
@@ -26,30 +45,40 @@ EXTENSION_METHODS = {
     ".csv": "save_to_csv"
 }
 
-OPERATIONS = ["x", "+", "-", "/"]
-
 
 class CebTirage:
     """
     Tirage Plaques et Recherche
     """
 
-    def __init__(self, plaques: List[int] | None = None, search: int = 0) -> None:
+    def __init__(self, plaques: List[int] | None = None, search: int = 0, game: CebGame = JEUCLASSIQUE) -> None:
         """
             Initialise une instance de CebTirage.
 
             :param plaques: Liste d'entiers représentant les plaques.
             :param search: Valeur entière à rechercher.
+            :param game: Les règles du jeu : plaques disponibles, nombre de plaques et recherches.
             """
         super().__init__()
-        self._plaques: List[CebPlaque] = [CebPlaque(0) for _ in range(6)]
+        self._game: CebGame = game
+        self._plaques: List[CebPlaque] = [CebPlaque(0) for _ in range(game.size)]
         self._search_value: IntSearch = IntSearch(0)
         self._solutions: List[CebBase] = []
+        self._keys: Dict[Tuple[str, ...], CebBase] = {}
         self._diff: int = maxsize
         self._status: CebStatus = CebStatus.Indefini
+        self._stopped: bool = False
+        self._canonical: bool = False
+        self._progress: ObsEvent = ObsEvent()
+        self._progress_interval: float = 0.2
+        self._progress_start: float = 0.0
+        self._progress_time: float = 0.0
+        self._nodes: int = 0
+        self._batch: int = 0
+        self._batch_changed: bool = False
 
         if plaques and search:
-            for index, value in enumerate(plaques[:6]):
+            for index, value in enumerate(plaques[:game.size]):
                 self._plaques[index].value = value
             self.search = search
         else:
@@ -97,6 +126,29 @@ class CebTirage:
         self.disconnect_search()
         self.disconnect_plaques()
 
+    @contextmanager
+    def batch_update(self) -> Iterator[CebTirage]:
+        """
+        Regroupe les modifications des plaques et de la recherche.
+
+        Dans le bloc, `data_changed` ne réinitialise pas l'état à chaque valeur modifiée :
+        `clear` est appelé une seule fois, à la sortie du bloc le plus externe, si une valeur
+        a changé. Les autres observateurs des plaques et de la recherche sont notifiés normalement.
+
+        e.g.:
+            with tirage.batch_update():
+                tirage.plaques = [1, 2, 3, 4, 5, 6]
+                tirage.search = 720
+        """
+        self._batch += 1
+        try:
+            yield self
+        finally:
+            self._batch -= 1
+            if not self._batch and self._batch_changed:
+                self._batch_changed = False
+                self.clear()
+
     def clear(self) -> CebStatus:
         """
         Réinitialise l'état de l'objet CebTirage.
@@ -107,7 +159,9 @@ class CebTirage:
         :return: Le statut actuel de l'objet CebTirage.
         """
         self._solutions = []
+        self._keys = {}
         self._diff = maxsize
+        self._stopped = False
         self.valid()
         return self.status
 
@@ -165,15 +219,29 @@ class CebTirage:
         Génère un tirage aléatoire de plaques et une valeur de recherche.
 
         """
-        self.disconnect_all()
-        self.search = randint(100, 999)
+        plaques, search = self._game.random()
+        with self.batch_update():
+            self.search = search
+            for plaque, value in zip(self._plaques, plaques):
+                plaque.value = value
+        return self._status
 
-        liste_plaques = LISTEPLAQUES[:]
-        for plaque in self._plaques:
-            index = randint(0, len(liste_plaques) - 1)
-            plaque.value = liste_plaques.pop(index)
-        self.connect_all()
-        return self.clear()
+    def assign(self, plaques: List[int], search: int) -> CebStatus:
+        """
+        Affecte les plaques et la recherche, l'état n'étant réinitialisé qu'une fois.
+
+        Les plaques non fournies sont remises à 0 : le tirage ne dépend pas du tirage
+        précédent, et un tirage trop court est invalide.
+
+        :param plaques: Liste d'entiers représentant les plaques.
+        :param search: Valeur entière à rechercher.
+        :return: Le statut du tirage.
+        """
+        with self.batch_update():
+            self.search = search
+            for index, plaque in enumerate(self._plaques):
+                plaque.value = plaques[index] if index < len(plaques) else 0
+        return self._status
 
     @property
     def json(self) -> str:
@@ -196,6 +264,97 @@ class CebTirage:
         """
         return self._diff
 
+    @property
+    def game(self) -> CebGame:
+        """
+        Retourne les règles du jeu du tirage.
+        """
+        return self._game
+
+    @property
+    def canonical(self) -> bool:
+        """
+        Indique si les solutions sont dédoublonnées sur leur forme canonique.
+
+        Returns:
+            bool: True si deux solutions effectuant les mêmes opérations dans un ordre
+            différent ne sont retenues qu'une fois.
+        """
+        return self._canonical
+
+    @canonical.setter
+    def canonical(self, value: bool):
+        """
+        Active ou désactive le dédoublonnage des solutions sur leur forme canonique.
+
+        Parameters:
+            value (bool): True pour ne retenir qu'une solution par forme canonique.
+        """
+        if value != self._canonical:
+            self._canonical = value
+            self.clear()
+
+    @property
+    def stopped(self) -> bool:
+        """
+        Indique si la dernière résolution a été arrêtée avant la fin de l'exploration.
+
+        Returns:
+            bool: True si les solutions sont les meilleures trouvées avant l'arrêt.
+        """
+        return self._stopped
+
+    @property
+    def progress(self) -> ObsEvent:
+        """
+        Signal d'avancement de la résolution, émis avec le tirage et un CebProgress.
+
+        Le signal est émis au plus une fois par `progress_interval` pendant l'exploration
+        en profondeur, puis une dernière fois en fin de résolution.
+
+        Returns:
+            ObsEvent: Le signal d'avancement.
+        """
+        return self._progress
+
+    @property
+    def progress_interval(self) -> float:
+        """
+        Retourne l'intervalle minimal entre deux émissions du signal d'avancement, en secondes.
+        """
+        return self._progress_interval
+
+    @progress_interval.setter
+    def progress_interval(self, value: float):
+        """
+        Définit l'intervalle minimal entre deux émissions du signal d'avancement.
+
+        Parameters:
+            value (float): L'intervalle en secondes.
+        """
+        self._progress_interval = value
+
+    @property
+    def nodes(self) -> int:
+        """
+        Retourne le nombre d'états explorés par la dernière résolution en profondeur.
+        """
+        return self._nodes
+
+    def _report(self, nodes: int, force: bool = False) -> None:
+        """
+        Émet le signal d'avancement si l'intervalle minimal est écoulé.
+
+        :param nodes: Nombre d'états explorés.
+        :param force: Émet le signal quel que soit l'intervalle écoulé.
+        """
+        self._nodes = nodes
+        now = monotonic()
+        if force or now - self._progress_time >= self._progress_interval:
+            self._progress_time = now
+            self._progress.emit(self, CebProgress(
+                nodes, now - self._progress_start, self._diff, len(self._solutions)))
+
     @property
     def count(self) -> int:
         """
@@ -259,35 +418,28 @@ class CebTirage:
     def plaques(self, plq: List[int]):
         """
         Sets the values of the plaques attribute with the provided list of integers.
-        Only the first six values of the provided list are considered.
+        Only the first `game.size` values of the provided list are considered.
 
         Args:
             plq (List[int]): A list of integers representing the new values for the
             plaques attribute.
         """
-        self.disconnect_plaques()
-        for index, value in enumerate(plq[:6]):
-            self._plaques[index].value = value
-        self.connect_plaques()
-        self.clear()
+        with self.batch_update():
+            for index, value in enumerate(plq[:self._game.size]):
+                self._plaques[index].value = value
 
     def valid(self) -> CebStatus:
         """
         Valide le tirage actuel.
 
-        Cette méthode vérifie si la valeur de recherche est comprise entre 100 et 999
-        et si le nombre de plaques est égal à 6. Elle vérifie également que chaque plaque
-        est présente dans la liste `LISTEPLAQUES` et que leur nombre est suffisant.
+        Cette méthode vérifie, selon les règles du jeu (`game`), si la valeur de recherche
+        est dans l'intervalle des recherches et si le nombre de plaques est celui d'un tirage.
+        Elle vérifie également que chaque plaque est disponible et que leur nombre est suffisant.
 
         :return: Le statut actuel de l'objet CebTirage, soit `CebStatus.Valide` soit `CebStatus.Invalide`.
         """
-        self._status = CebStatus.Valide if 100 <= self._search_value.value <= 999 and len(
-            self._plaques) == 6 else CebStatus.Invalide
-        if self._status == CebStatus.Valide:
-            for plaque in self._plaques:
-                if LISTEPLAQUES.count(plaque.value) < self._plaques.count(plaque):
-                    self._status = CebStatus.Invalide
-                    break
+        self._status = CebStatus.Valide if self._game.valid(
+            [plaque.value for plaque in self._plaques], self._search_value.value) else CebStatus.Invalide
         return self._status
 
     def data_changed(self, sender,  old_value):
@@ -300,6 +452,9 @@ class CebTirage:
         :param sender: L'objet qui a déclenché le changement.
         :param old_value: L'ancienne valeur avant le changement.
         """
+        if self._batch:
+            self._batch_changed = True
+            return
         self.clear()
 
     @property
@@ -316,29 +471,127 @@ class CebTirage:
         Ajoute l'opération sol aux solutions si la valeur est plus proche ou égale
         à celles déjà trouvées.
 
+        Les solutions retenues sont indexées par leur clé pour écarter les doublons sans
+        parcourir la liste. Avec `canonical`, la clé est la forme canonique, et la solution
+        retenue pour une forme est celle de plus petite écriture (`key`) : elle ne dépend
+        ni du moteur ni de l'ordre de découverte.
+
         :param sol: L'opération à ajouter aux solutions.
-        :return: Rien.
+        :return: True si l'opération a été ajoutée comme nouvelle solution.
         """
         diff: int = abs(sol.value - self._search_value.value)
         if diff > self._diff:
-            return
+            return False
+        key = sol.canonical_key if self._canonical else sol.key
         if diff != self._diff:
             self._solutions = [sol]
+            self._keys = {key: sol}
             self._diff = diff
-        elif sol not in self._solutions:
+        elif key not in self._keys:
+            self._keys[key] = sol
             self._solutions.append(sol)
-
-    def solve(self):
+        else:
+            if self._canonical and sol.key < self._keys[key].key:
+                # remplace le représentant de la forme canonique, s'il est conservé
+                previous = self._keys[key]
+                self._keys[key] = sol
+                for index, solution in enumerate(self._solutions):
+                    if solution is previous:
+                        self._solutions[index] = sol
+                        break
+            return False
+        return True
+
+    def solve(self, engine: CebEngine | None = None, transposition: CebTransposition | None = None,
+              workers: int = 1, stop: CebStop | None = None, cache: CebCache | None = None,
+              timeout: float = 0.0, pruning: CebPruning | None = None):
         """
         Résout le problème en utilisant les plaques et la valeur de recherche fournies.
 
+        L'arrêt anticipé (critère atteint, délai écoulé ou annulation) concerne les moteurs
+        en profondeur `Pile`, `RetourArriere` et `RangMinimal` : les meilleures solutions trouvées
+        avant l'arrêt sont retenues et `stopped` est vrai. Les moteurs par sous-ensembles
+        `SousEnsembles` et `Vectorise` vérifient l'annulation et le délai entre deux combinaisons
+        de sous-ensembles, les solutions étant cherchées parmi les valeurs déjà calculées.
+        Si aucune solution n'a encore été trouvée, le statut redevient `CebStatus.Valide`.
+
+        :param engine: Le moteur de résolution à utiliser, None pour celui du jeu (`CebGame.engine`).
+        :param transposition: Table de transposition utilisée par le moteur `CebEngine.Pile`,
+            vidée avant la résolution.
+        :param workers: Nombre de processus utilisés par le moteur `CebEngine.Pile`.
+        :param stop: Critère d'arrêt anticipé, qui sert aussi de jeton d'annulation (`CebStop.cancel`).
+        :param cache: Cache des résultats : un tirage déjà résolu n'est pas résolu à nouveau.
+        :param timeout: Délai maximal de la résolution en secondes, 0 pour ne pas limiter ;
+            remplace celui de `stop` pour cette résolution, sans le modifier.
+        :param pruning: Règles d'élagage du moteur `CebEngine.Pile`, dont les compteurs
+            sont remis à zéro avant la résolution.
         :return: Le statut actuel de l'objet CebTirage.
         """
         if self._status == CebStatus.Invalide:
             return self._status
+        if engine is None:
+            engine = self._game.engine
 
         self._status = CebStatus.EnCours
-        self._solve()
+        self._solutions = []
+        self._keys = {}
+        self._diff = maxsize
+        self._stopped = False
+        self._nodes = 0
+        self._progress_start = self._progress_time = monotonic()
+        key = None
+        if cache is not None:
+            key = cache.key([plaque.value for plaque in self._plaques], self.search, engine, self._canonical)
+            entry = cache.get(key)
+            if entry is not None:
+                for solution in entry[1]:
+                    self._add_solution(solution)
+                return self._set_result()
+        if timeout and stop is None:
+            stop = CebStop(timeout=timeout)
+        if stop is not None:
+            # le délai de cette résolution est passé au démarrage : le critère de l'appelant n'est pas modifié
+            stop.start(timeout or None)
+        match engine:
+            case CebEngine.SousEnsembles:
+                self._solve_subsets(CebSubsets([plaque.value for plaque in self._plaques], stop))
+            case CebEngine.Vectorise:
+                # NumPy n'est importé que pour ce moteur
+                from ceb.vectorized import CebVectorized
+                self._solve_subsets(CebVectorized([plaque.value for plaque in self._plaques], stop))
+            case CebEngine.RangMinimal:
+                self._solve_min_rank(stop)
+            case CebEngine.RetourArriere:
+                self._solve_backtrack(stop)
+            case _:
+                if transposition is not None:
+                    transposition.clear()
+                if pruning is not None:
+                    pruning.clear()
+                if workers > 1:
+                    self._solve_parallel(workers, transposition, stop, pruning)
+                else:
+                    self._solve(transposition, stop=stop, pruning=pruning)
+        self._set_result()
+        if self._progress.has_connect():
+            self._report(self._nodes, True)
+        # un résultat partiel n'est pas mémorisé
+        partial = self._stopped or (engine == CebEngine.Pile and (
+                (transposition is not None and not transposition.complete) or (pruning is not None and pruning.rules)))
+        if key is not None and not partial:
+            cache.put(key, self._diff, self._solutions)
+        return self._status
+
+    def _set_result(self) -> CebStatus:
+        """
+        Trie les solutions par rang et met à jour le statut en fin de résolution.
+
+        :return: Le statut actuel de l'objet CebTirage.
+        """
+        if not self._solutions:
+            # résolution arrêtée avant la première solution
+            self.status = CebStatus.Valide
+            return self._status
         self._solutions.sort(key=lambda sol: sol.rank)
         self.status = CebStatus.CompteEstBon \
             if self._solutions[0].value == self.search else CebStatus.CompteApproche
@@ -357,44 +610,501 @@ class CebTirage:
         self.plaques = plaques
         return self.solve()
 
-    async def solve_async(self) -> CebStatus:
+    def lookup(self, table: CebTable) -> Tuple[CebStatus, int]:
+        """
+        Consulte une table précalculée, sans résoudre : l'état du tirage n'est pas modifié.
+
+        :param table: La table précalculée.
+        :return: Un tuple (statut, écart), le statut étant CebStatus.Invalide si le tirage
+            est invalide ou ne figure pas dans la table.
+        """
+        if self._status == CebStatus.Invalide:
+            return CebStatus.Invalide, 0
+        status, ecart, _, _ = table.lookup([plaque.value for plaque in self._plaques], self.search)
+        return status, ecart
+
+    def solve_all_targets(self) -> CebTargets:
+        """
+        Résout le tirage pour toutes les recherches du jeu (`game`) en une seule énumération
+        des valeurs atteignables ; l'état du tirage n'est pas modifié.
+
+        :return: L'index des résultats par recherche, les solutions étant reconstruites à la demande.
+        """
+        return CebTargets([plaque.value for plaque in self._plaques], self._game.search_min, self._game.search_max)
+
+    def solve_count(self) -> dict:
+        """
+        Dénombre les expressions les plus proches sans les construire ; l'état du tirage n'est pas modifié.
+
+        Le dénombrement (CebCounts) ne mémorise que des entiers par valeur atteignable :
+        la mémoire ne dépend pas du nombre de solutions. Il compte les arbres d'expressions
+        distincts, et non les écritures distinctes : `expressions` n'est pas le `count` de `solve`,
+        dont il diffère dès que plusieurs arbres ont la même écriture.
+
+        :return: Un dictionnaire avec les clés suivantes:
+            - plaques: Liste des valeurs des plaques.
+            - search: Valeur de recherche.
+            - status: Statut sous forme de chaîne de caractères.
+            - found: Liste des valeurs trouvées.
+            - ecart: Différence entre la valeur recherchée et la solution la plus proche.
+            - expressions: Nombre d'arbres d'expressions.
+            - ranks: Nombre d'arbres d'expressions par rang, par rang croissant.
+        """
+        plaques = [plaque.value for plaque in self._plaques]
+        result = {"plaques": plaques, "search": self.search, "status": str(CebStatus.Invalide),
+                  "found": [], "ecart": 0, "expressions": 0, "ranks": {}}
+        if self._status == CebStatus.Invalide:
+            return result
+        counts = CebCounts(plaques)
+        ecart, found, _, expressions = counts.solve(self.search)
+        ranks: Dict[int, int] = {}
+        for value in found:
+            for rank, number in counts.ranks(value).items():
+                ranks[rank] = ranks.get(rank, 0) + number
+        result.update(status=str(CebStatus.CompteEstBon if ecart == 0 else CebStatus.CompteApproche),
+                      found=found, ecart=ecart, expressions=expressions, ranks=dict(sorted(ranks.items())))
+        return result
+
+    async def solve_async(
+            self, engine: CebEngine | None = None, transposition: CebTransposition | None = None,
+            workers: int = 1, stop: CebStop | None = None, cache: CebCache | None = None,
+            timeout: float = 0.0) -> CebStatus:
         """
         Résout le problème de manière asynchrone.
 
         Cette méthode utilise `asyncio.to_thread` pour exécuter la méthode solve` dans un thread séparé.
-
+        Si la tâche est annulée, la résolution est annulée par `stop` et la tâche n'est
+        interrompue qu'une fois le thread terminé : le tirage conserve les meilleures solutions trouvées.
+
+        :param engine: Le moteur de résolution à utiliser, None pour celui du jeu (`CebGame.engine`).
+        :param transposition: Table de transposition utilisée par le moteur `CebEngine.Pile`.
+        :param workers: Nombre de processus utilisés par le moteur `CebEngine.Pile`.
+        :param stop: Critère d'arrêt anticipé et jeton d'annulation.
+        :param cache: Cache des résultats.
+        :param timeout: Délai maximal de la résolution en secondes, 0 pour ne pas limiter.
         :return: Le statut actuel de l'objet CebTirage après résolution.
         """
-        return await asyncio.to_thread(self.solve)
+        if stop is None:
+            stop = CebStop()
+        task = asyncio.ensure_future(
+            asyncio.to_thread(self.solve, engine, transposition, workers, stop, cache, timeout))
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            stop.cancel()
+            await task
+            raise
 
-    def _solve(self) -> None:
+    @staticmethod
+    def _next_list(current_list: List[CebBase], ceb_operation: CebOperation, ii: int, jj: int) -> List[CebBase]:
         """
-        Résout le problème en utilisant une pile pour explorer toutes les combinaisons possibles de plaques et d'opérations.
+        Génère une nouvelle liste en appliquant une opération sur deux plaques et en excluant les plaques utilisées.
+
+        :param current_list: Liste actuelle de plaques.
+        :param ceb_operation: Opération à appliquer.
+        :param ii: Index de la première plaque.
+        :param jj: Index de la deuxième plaque.
+        :return: Nouvelle liste de plaques après application de l'opération.
         """
+        return current_list[:ii] + current_list[ii + 1:jj] + current_list[jj + 1:] + [ceb_operation]
 
-        def next_list(current_list: List[CebBase], ceb_operation: CebOperation, ii: int, jj: int) -> List[CebBase]:
-            """
-            Génère une nouvelle liste en appliquant une opération sur deux plaques et en excluant les plaques utilisées.
+    def iter_solutions(self, store: bool = False, stop: CebStop | None = None) -> Iterator[Tuple[int, CebBase]]:
+        """
+        Résout le problème en retournant les solutions au fur et à mesure de leur découverte.
 
-            :param current_list: Liste actuelle de plaques.
-            :param ceb_operation: Opération à appliquer.
-            :param ii: Index de la première plaque.
-            :param jj: Index de la deuxième plaque.
-            :return: Nouvelle liste de plaques après application de l'opération.
-            """
-            return [x for k, x in enumerate(current_list) if k not in (ii, jj)] + [ceb_operation]
+        Chaque solution est retournée avec le meilleur écart courant. Une solution n'est
+        retournée qu'une fois par écart ; celles dont l'écart est ensuite amélioré ne sont
+        pas retirées, c'est à l'appelant de les ignorer.
+
+        Sans `store`, seules les solutions du meilleur écart courant sont mémorisées pour
+        éliminer les doublons : `solutions` reste vide, `ecart` et `status` sont mis à jour
+        en fin de résolution.
+
+        Si l'itération est abandonnée avant la fin (`break`, `close`), l'état est mis à jour
+        de la même façon avec les meilleurs résultats trouvés, et `stopped` est vrai.
+
+        :param store: Conserve les solutions dans `solutions` comme `solve`.
+        :param stop: Critère d'arrêt anticipé et jeton d'annulation.
+        :return: Un itérateur sur les couples (écart, solution).
+        """
+        if self._status == CebStatus.Invalide:
+            return
+
+        self._status = CebStatus.EnCours
+        self._solutions = []
+        self._keys = {}
+        self._diff = maxsize
+        self._stopped = False
+        self._nodes = 0
+        self._progress_start = self._progress_time = monotonic()
+        if stop is not None:
+            stop.start()
+        explore = self._explore(stop=stop)
+        finished = False
+        try:
+            for solution in explore:
+                if self._add_solution(solution):
+                    if not store:
+                        self._solutions.clear()
+                    yield self._diff, solution
+            finished = True
+        finally:
+            explore.close()
+            if not finished:
+                # itération abandonnée par l'appelant
+                self._stopped = True
+            self._solutions.sort(key=lambda sol: sol.rank)
+            if self._diff == maxsize:
+                # résolution arrêtée avant la première solution
+                self._status = CebStatus.Valide
+            else:
+                self._status = CebStatus.CompteEstBon if self._diff == 0 else CebStatus.CompteApproche
+            if self._progress.has_connect():
+                self._report(self._nodes, True)
+
+    async def iter_solutions_async(self, store: bool = False, queue_size: int = 64) -> AsyncIterator[Tuple[int, CebBase]]:
+        """
+        Version asynchrone de `iter_solutions`.
+
+        La résolution s'exécute dans un thread séparé et transmet les solutions par une
+        file d'attente bornée : l'exploration attend lorsque le consommateur prend du retard.
+        Si l'itération est abandonnée, l'exploration est annulée.
+
+        :param store: Conserve les solutions dans `solutions` comme `solve`.
+        :param queue_size: Taille de la file d'attente.
+        :return: Un itérateur asynchrone sur les couples (écart, solution).
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(queue_size)
+        closed = threading.Event()
+        stop = CebStop()
+        end = object()
+
+        def produce():
+            solutions = self.iter_solutions(store, stop)
+            try:
+                for item in solutions:
+                    if closed.is_set():
+                        break
+                    asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+            finally:
+                # met à jour l'état du tirage même si l'itération est abandonnée
+                solutions.close()
+                if not closed.is_set():
+                    asyncio.run_coroutine_threadsafe(queue.put(end), loop).result()
+
+        task = asyncio.ensure_future(asyncio.to_thread(produce))
+        try:
+            while (item := await queue.get()) is not end:
+                yield item
+            await task
+        finally:
+            closed.set()
+            # l'exploration s'arrête sans attendre la prochaine solution
+            stop.cancel()
+            while not task.done():
+                # libère le producteur bloqué sur une file pleine
+                while not queue.empty():
+                    queue.get_nowait()
+                await asyncio.sleep(0.01)
+
+    def _explore(self, transposition: CebTransposition | None = None,
+                 stack: List[List[CebBase]] | None = None, stop: CebStop | None = None,
+                 pruning: CebPruning | None = None) -> Iterator[CebBase]:
+        """
+        Explore à l'aide d'une pile toutes les combinaisons possibles de plaques et d'opérations.
+
+        Seules les plaques et opérations dont l'écart à la recherche ne dépasse pas
+        le meilleur écart courant sont retournées, dans l'ordre de leur découverte.
+
+        :param transposition: Table des états déjà explorés, ignorés s'ils se représentent.
+        :param stack: Pile initiale, par défaut la liste des plaques.
+        :param stop: Critère d'arrêt anticipé, vérifié avant chaque état.
+        :param pruning: Règles d'élagage, testées sur les valeurs avant de créer l'opération.
+        :return: Un itérateur sur les plaques et opérations candidates.
+        """
+        search = self._search_value.value
+        next_list = self._next_list
+        opcodes = range(len(OPERATIONS))
+        report = self._progress.has_connect()
+        nodes = self._nodes
+        # les règles sont testées sur les valeurs, avant de créer l'opération
+        rules = pruning.rules if pruning is not None else frozenset()
+        operande = CebRule.ResultatOperande in rules
+        annule = CebRule.AnnuleOperation in rules
+        operande_count = annule_count = 0
+        if stack is None:
+            stack = [[CebValeur(plaque.value) for plaque in self._plaques]]
+        try:
+            while stack:
+                # les clés comptent les solutions retenues, même si `iter_solutions` ne les conserve pas
+                if stop is not None and stop.reached(self._diff, len(self._keys)):
+                    self._stopped = True
+                    break
+                current_liste = stack.pop()
+                if transposition is not None and transposition.seen(current_liste):
+                    continue
+                nodes += 1
+                if report and not nodes & 1023:
+                    self._report(nodes)
+                if annule and len(current_liste) > 1:
+                    # valeurs des opérandes de chaque élément de la liste, s'il reste un couple à combiner
+                    operands = [elt.operands for elt in current_liste]
+                undo = ()
+                for ix, plq in enumerate(current_liste):
+                    vp = plq.value
+                    if abs(vp - search) <= self._diff:
+                        yield plq
+                    for jx in range(ix + 1, len(current_liste)):
+                        q = current_liste[jx]
+                        vq = q.value
+                        g, d = (vp, vq) if vp >= vq else (vq, vp)
+                        if annule:
+                            undo = operands[ix] + operands[jx]
+                        for opcode in opcodes:
+                            value = evaluate(g, opcode, d)
+                            if not value:
+                                continue
+                            if operande and (value == g or value == d):
+                                operande_count += 1
+                                continue
+                            if undo and value in undo:
+                                annule_count += 1
+                                continue
+                            stack.append(next_list(current_liste, CebOperation(plq, opcode, q), ix, jx))
+        finally:
+            self._nodes = nodes
+            if rules:
+                pruning.merge({rule: count for rule, count in ((CebRule.ResultatOperande, operande_count),
+                                                               (CebRule.AnnuleOperation, annule_count))
+                               if rule in rules})
+
+    def _solve(self, transposition: CebTransposition | None = None,
+               stack: List[List[CebBase]] | None = None, stop: CebStop | None = None,
+               pruning: CebPruning | None = None) -> None:
+        """
+        Résout le problème en utilisant une pile pour explorer toutes les combinaisons possibles de plaques et d'opérations.
 
-        stack = [self.plaques]
+        :param transposition: Table des états déjà explorés, ignorés s'ils se représentent.
+        :param stack: Pile initiale, par défaut la liste des plaques.
+        :param stop: Critère d'arrêt anticipé, vérifié avant chaque état.
+        :param pruning: Règles d'élagage, appliquées avant d'empiler l'état issu d'une opération.
+        """
+        for solution in self._explore(transposition, stack, stop, pruning):
+            self._add_solution(solution)
+
+    def _solve_backtrack(self, stop: CebStop | None = None) -> None:
+        """
+        Explore toutes les combinaisons par retour arrière, dans le même ordre que `_solve`.
+
+        L'état courant est un tableau de travail d'identifiants de noeuds, modifié en place
+        pour chaque opération puis restauré. Les opérations ne sont décrites que par leur valeur,
+        leurs opérandes et leur code, dans des tableaux indexés par profondeur : une CebOperation
+        n'est créée que pour les candidats proposés à `_add_solution`.
+
+        :param stop: Critère d'arrêt anticipé, vérifié avant chaque état.
+        """
+        search = self.search
+        size = len(self._plaques)
+        leaves: List[CebBase] = [CebValeur(plaque.value) for plaque in self._plaques]
+        # noeuds 0..size-1 : les plaques ; noeud size + d : l'opération de profondeur d
+        values: List[int] = [leaf.value for leaf in leaves] + [0] * (size - 1)
+        lefts: List[int] = [0] * len(values)
+        rights: List[int] = [0] * len(values)
+        opcodes: List[int] = [0] * len(values)
+        expressions: List[CebBase | None] = leaves + [None] * (size - 1)
+        work: List[int] = list(range(size))
+        report = self._progress.has_connect()
+        explored = 0
+
+        def node(index: int) -> CebBase:
+            expression = expressions[index]
+            if expression is None:
+                expression = expressions[index] = CebOperation(
+                    node(lefts[index]), opcodes[index], node(rights[index]))
+            return expression
+
+        def explore(count: int) -> bool:
+            nonlocal explored
+            if stop is not None and stop.reached(self._diff, len(self._solutions)):
+                self._stopped = True
+                return False
+            explored += 1
+            if report and not explored & 1023:
+                self._report(explored)
+            for ix in range(count):
+                if abs(values[work[ix]] - search) <= self._diff:
+                    self._add_solution(node(work[ix]))
+            if count == 1:
+                return True
+            new = 2 * size - count
+            # les états fils sont explorés dans l'ordre inverse de leur empilement par `_solve`
+            for ix in range(count - 2, -1, -1):
+                a = work[ix]
+                for jx in range(count - 1, ix, -1):
+                    b = work[jx]
+                    g, d = (values[a], values[b]) if values[a] >= values[b] else (values[b], values[a])
+                    for opcode in (DIVISION, SOUSTRACTION, ADDITION, MULTIPLICATION):
+                        value = evaluate(g, opcode, d)
+                        if not value:
+                            continue
+                        values[new] = value
+                        lefts[new] = a
+                        rights[new] = b
+                        opcodes[new] = opcode
+                        expressions[new] = None
+                        # retire b puis a en conservant l'ordre, et ajoute l'opération à la fin
+                        for k in range(jx, count - 1):
+                            work[k] = work[k + 1]
+                        for k in range(ix, count - 2):
+                            work[k] = work[k + 1]
+                        work[count - 2] = new
+                        running = explore(count - 1)
+                        for k in range(count - 2, ix, -1):
+                            work[k] = work[k - 1]
+                        work[ix] = a
+                        for k in range(count - 1, jx, -1):
+                            work[k] = work[k - 1]
+                        work[jx] = b
+                        if not running:
+                            return False
+            return True
+
+        explore(size)
+        self._nodes = explored
+
+    def _solve_depth(self, depth: int, ecart: int, stop: CebStop | None = None) -> None:
+        """
+        Explore en profondeur les combinaisons d'au plus `depth` opérations.
+
+        Au dernier niveau, une opération n'est retenue que si son écart à la recherche
+        vaut `ecart`, le meilleur écart possible.
+
+        :param depth: Nombre maximal d'opérations.
+        :param ecart: Le meilleur écart possible.
+        :param stop: Critère d'arrêt anticipé, vérifié avant chaque état.
+        """
+        search = self.search
+        next_list = self._next_list
+        opcodes = range(len(OPERATIONS))
+        stack: List[List[CebBase]] = [[CebValeur(plaque.value) for plaque in self._plaques]]
+        last = len(stack[0]) - depth + 1
+        report = self._progress.has_connect()
+        nodes = self._nodes
         while stack:
+            if stop is not None and stop.reached(self._diff, len(self._solutions)):
+                self._stopped = True
+                break
             current_liste = stack.pop()
+            nodes += 1
+            if report and not nodes & 1023:
+                self._report(nodes)
+            size = len(current_liste)
             for ix, plq in enumerate(current_liste):
                 self._add_solution(plq)
-                for jx in range(ix + 1, len(current_liste)):
+                if size < last:
+                    continue
+                for jx in range(ix + 1, size):
                     q = current_liste[jx]
-                    for operation in OPERATIONS:
-                        oper: CebOperation = CebOperation(plq, operation, q)
-                        if oper.value:
+                    for opcode in opcodes:
+                        oper: CebOperation = CebOperation(plq, opcode, q)
+                        if oper.value and (size > last or abs(oper.value - search) == ecart):
                             stack.append(next_list(current_liste, oper, ix, jx))
+        self._nodes = nodes
+
+    def _solve_subsets(self, subsets: CebSubsets) -> None:
+        """
+        Retient les solutions les plus proches calculées sur les sous-ensembles de plaques.
+
+        :param subsets: Les valeurs atteignables des sous-ensembles de plaques,
+            éventuellement interrompues par le critère d'arrêt.
+        """
+        self._diff, solutions = subsets.solve(self.search)
+        self._stopped = subsets.stopped
+        for solution in solutions:
+            self._add_solution(solution)
+
+    def _solve_min_rank(self, stop: CebStop | None = None) -> None:
+        """
+        Recherche les solutions par rang croissant et s'arrête au premier rang
+        qui atteint le meilleur écart possible, calculé par `CebSubsets`.
+
+        :param stop: Critère d'arrêt anticipé, vérifié avant chaque état.
+        """
+        ecart = CebSubsets([plaque.value for plaque in self._plaques], stop).ecart(self.search)
+        for depth in range(1, len(self._plaques)):
+            self._solutions = []
+            self._keys = {}
+            self._diff = maxsize
+            self._solve_depth(depth, ecart, stop)
+            if self._diff == ecart or self._stopped:
+                break
+
+    @staticmethod
+    def _solve_branch(plaques: List[int], search: int, branche: List[CebBase],
+                      transposition: CebTransposition | None = None,
+                      stop: CebStop | None = None, rules: frozenset[CebRule] | None = None
+                      ) -> Tuple[bool, List[CebBase], int, Dict[CebRule, int]]:
+        """
+        Explore une branche du premier niveau dans un processus de calcul.
+
+        :param plaques: Valeurs des plaques du tirage.
+        :param search: Valeur recherchée.
+        :param branche: Liste des plaques et de l'opération de la branche.
+        :param transposition: Table de transposition propre à la branche.
+        :param stop: Critère d'arrêt anticipé propre à la branche.
+        :param rules: Règles d'élagage, appliquées avec des compteurs propres à la branche.
+        :return: Un tuple (arrêt anticipé, solutions les plus proches trouvées dans la branche,
+            dans l'ordre de découverte, nombre d'états explorés, opérations écartées par règle).
+        """
+        pruning = CebPruning(rules) if rules is not None else None
+        tirage = CebTirage(plaques, search)
+        tirage._solve(transposition, [branche], stop, pruning)
+        return tirage._stopped, tirage._solutions, tirage._nodes, pruning.rejections if pruning is not None else {}
+
+    def _solve_parallel(self, workers: int, transposition: CebTransposition | None = None,
+                        stop: CebStop | None = None, pruning: CebPruning | None = None) -> None:
+        """
+        Résout le problème en répartissant les branches du premier niveau de `_solve`
+        (couple de plaques et opération) entre plusieurs processus.
+
+        Les solutions de chaque branche sont fusionnées avec `_add_solution` dans l'ordre
+        où la pile les aurait explorées : le résultat est identique à celui de `_solve`.
+
+        :param workers: Nombre de processus.
+        :param transposition: Table de transposition, copiée pour chaque branche.
+        :param stop: Critère d'arrêt anticipé, copié pour chaque branche et vérifié après chaque fusion.
+        :param pruning: Règles d'élagage, appliquées à chaque branche ; les compteurs des branches y sont cumulés.
+        """
+        leaves: List[CebBase] = [CebValeur(plaque.value) for plaque in self._plaques]
+        branches: List[List[CebBase]] = []
+        for ix, plq in enumerate(leaves):
+            self._add_solution(plq)
+            for jx in range(ix + 1, len(leaves)):
+                for opcode in range(len(OPERATIONS)):
+                    oper = CebOperation(plq, opcode, leaves[jx])
+                    if oper.value and (pruning is None or not pruning.reject(oper)):
+                        branches.append(self._next_list(leaves, oper, ix, jx))
+        # la pile dépile les branches dans l'ordre inverse de leur création
+        branches.reverse()
+        plaques = [plaque.value for plaque in self._plaques]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for stopped, solutions, nodes, rejections in executor.map(
+                    self._solve_branch, repeat(plaques), repeat(self.search),
+                    branches, repeat(transposition), repeat(stop),
+                    repeat(pruning.rules if pruning is not None else None)):
+                for solution in solutions:
+                    self._add_solution(solution)
+                if pruning is not None:
+                    pruning.merge(rejections)
+                self._stopped = self._stopped or stopped
+                self._nodes += nodes
+                if self._progress.has_connect():
+                    self._report(self._nodes)
+                if stop is not None and (stop.reached(self._diff, len(self._solutions)) or stop.expired()):
+                    self._stopped = True
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
 
     @property
     def result(self) -> dict:
@@ -521,19 +1231,83 @@ class CebTirage:
 
 
 def solve(
-        plaques: List[int] = (), search: int = 0) -> CebTirage:
+        plaques: List[int] = (), search: int = 0, engine: CebEngine | None = None,
+        cache: CebCache | None = None, timeout: float = 0.0, game: CebGame = JEUCLASSIQUE) -> CebTirage:
     """
     Crée une instance de CebTirage et résout le problème.
 
     :param plaques: Liste d'entiers représentant les plaques.
     :param search: Valeur entière à rechercher.
+    :param engine: Le moteur de résolution à utiliser, None pour celui du jeu (`CebGame.engine`).
+    :param cache: Cache des résultats.
+    :param timeout: Délai maximal de la résolution en secondes, 0 pour ne pas limiter.
+    :param game: Les règles du jeu.
     :return: Une instance de CebTirage après résolution.
     """
-    _tirage = CebTirage(plaques, search)
-    _tirage.solve()
+    _tirage = CebTirage(plaques, search, game)
+    _tirage.solve(engine, cache=cache, timeout=timeout)
     return _tirage
 
 
+def is_solvable(plaques: List[int], search: int, game: CebGame = JEUCLASSIQUE) -> CebBase | None:
+    """
+    Indique si le compte est bon, sans énumérer toutes les solutions, par rencontre au milieu.
+
+    :param plaques: Liste d'entiers représentant les plaques.
+    :param search: Valeur entière à rechercher.
+    :param game: Les règles du jeu.
+    :return: Une solution exacte de rang minimal, None si le compte n'est pas bon
+        ou si le tirage est invalide.
+    """
+    if not game.valid(plaques, search):
+        return None
+    return CebMeet(plaques).witness(search)
+
+
+def solve_all_targets(plaques: List[int], game: CebGame = JEUCLASSIQUE) -> CebTargets:
+    """
+    Résout un tirage pour toutes les recherches du jeu, de 100 à 999 par défaut.
+
+    :param plaques: Liste d'entiers représentant les plaques.
+    :param game: Les règles du jeu.
+    :return: L'index des résultats par recherche.
+    """
+    return CebTargets(plaques, game.search_min, game.search_max)
+
+
+def solve_count(plaques: List[int], search: int, game: CebGame = JEUCLASSIQUE) -> dict:
+    """
+    Dénombre les expressions les plus proches d'un tirage sans les construire.
+
+    :param plaques: Liste d'entiers représentant les plaques.
+    :param search: Valeur entière à rechercher.
+    :param game: Les règles du jeu.
+    :return: Le dénombrement (voir CebTirage.solve_count).
+    """
+    return CebTirage(plaques, search, game).solve_count()
+
+
+def lookup(plaques: List[int], search: int, table: CebTable,
+           game: CebGame | None = None) -> Tuple[CebStatus, int]:
+    """
+    Consulte une table précalculée pour un tirage, sans le résoudre.
+
+    La table ne contient que des tirages de son jeu : elle est consultée directement,
+    quel que soit le jeu pour lequel elle a été générée.
+
+    :param plaques: Liste d'entiers représentant les plaques.
+    :param search: Valeur entière à rechercher.
+    :param table: La table précalculée.
+    :param game: Les règles du jeu, vérifiées avant la consultation si elles sont fournies.
+    :return: Un tuple (statut, écart), le statut étant CebStatus.Invalide si le tirage
+        est invalide ou ne figure pas dans la table.
+    """
+    if game is not None and not game.valid(plaques, search):
+        return CebStatus.Invalide, 0
+    status, ecart, _, _ = table.lookup(plaques, search)
+    return status, ecart
+
+
 if __name__ == "__main__":
     """
     Point d'entrée principal du script.
@@ -0,0 +1,108 @@
+"""
+Table de transposition pour l'exploration en profondeur du compte.
+"""
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import Dict, Hashable, List
+
+from ceb.base import CebBase
+from ceb.operation import CebOperation
+
+#: Nombre d'états mémorisés par défaut
+TAILLEMAX: int = 1_000_000
+
+
+class CebTransposition:
+    """
+    Mémorise les états déjà explorés par `CebTirage._solve` afin de ne pas
+    développer plusieurs fois le même sous-arbre.
+
+    Par défaut, un état est identifié par le multi-ensemble trié des valeurs restantes :
+    les valeurs trouvées et l'écart sont inchangés, mais seules les solutions du premier
+    état exploré sont conservées. Avec `complete`, un état est identifié par ses opérations,
+    triées par valeur : toutes les solutions distinctes sont conservées, dans le même ordre ;
+    seuls les états comportant au moins deux opérations sont alors mémorisés.
+
+    Lorsque la table est pleine, l'état le moins récemment utilisé est oublié.
+    """
+
+    def __init__(self, max_size: int = TAILLEMAX, complete: bool = False) -> None:
+        """
+        Initialise une table de transposition vide.
+
+        :param max_size: Nombre maximal d'états mémorisés.
+        :param complete: Conserve toutes les solutions distinctes si vrai.
+        """
+        super().__init__()
+        self._max_size: int = max_size
+        self._complete: bool = complete
+        self._table: Dict[Hashable, None] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    @property
+    def max_size(self) -> int:
+        """
+        Retourne le nombre maximal d'états mémorisés.
+        """
+        return self._max_size
+
+    @property
+    def complete(self) -> bool:
+        """
+        Indique si toutes les solutions distinctes sont conservées.
+        """
+        return self._complete
+
+    def __len__(self) -> int:
+        """
+        Retourne le nombre d'états mémorisés.
+        """
+        return len(self._table)
+
+    def clear(self) -> None:
+        """
+        Vide la table et remet les compteurs à zéro.
+        """
+        self._table.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def key(self, liste: List[CebBase]) -> Hashable:
+        """
+        Retourne la clé canonique d'un état.
+
+        :param liste: Les plaques et opérations restantes.
+        :return: Le multi-ensemble trié des valeurs, ou les opérations triées par valeur
+            (ordre conservé entre valeurs égales) si `complete`.
+        """
+        if not self._complete:
+            return tuple(sorted(node.value for node in liste))
+        return tuple(node.key if isinstance(node, CebOperation) else node.value
+                     for node in sorted(liste, key=attrgetter("value")))
+
+    def seen(self, liste: List[CebBase]) -> bool:
+        """
+        Indique si un état équivalent a déjà été exploré, et mémorise l'état sinon.
+
+        :param liste: Les plaques et opérations restantes.
+        :return: True si l'état peut être ignoré.
+        """
+        if self._complete and (len(liste) < 2 or not isinstance(liste[-2], CebOperation)):
+            # avec une seule opération, un état ne se répète qu'avec des plaques identiques
+            return False
+        key = self.key(liste)
+        table = self._table
+        if key in table:
+            # l'état redevient le plus récemment utilisé
+            del table[key]
+            table[key] = None
+            self.hits += 1
+            return True
+        self.misses += 1
+        if table and len(table) >= self._max_size:
+            del table[next(iter(table))]
+            self.evictions += 1
+        table[key] = None
+        return False
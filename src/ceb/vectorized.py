@@ -0,0 +1,116 @@
+"""
+Résolution du compte par sous-ensembles, les valeurs atteignables étant calculées avec NumPy.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+
+from ceb.subsets import CebSubsets
+
+
+def combine(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """
+    Retourne toutes les valeurs obtenues en combinant une valeur de `left` et une valeur
+    de `right`, les règles de CebOperation étant appliquées sous forme de masques :
+    pas de soustraction nulle, pas de multiplication ni de division par 1,
+    division exacte uniquement.
+
+    :param left: Valeurs atteignables du premier sous-ensemble.
+    :param right: Valeurs atteignables du second sous-ensemble.
+    :return: Les valeurs obtenues, avec doublons.
+    """
+    a = left[:, np.newaxis]
+    b = right[np.newaxis, :]
+    g = np.maximum(a, b)
+    d = np.minimum(a, b)
+    useful = d > 1
+    exact = useful & (g % d == 0)
+    return np.concatenate((
+        (g + d).ravel(),
+        (g - d)[g != d],
+        (g * d)[useful],
+        (g // d)[exact],
+    ))
+
+
+class CebVectorized(CebSubsets):
+    """
+    Variante de CebSubsets dont les valeurs atteignables de chaque sous-ensemble sont
+    des tableaux NumPy triés, combinés par diffusion.
+
+    Les ensembles Python ne sont construits que pour les sous-ensembles parcourus
+    lors de la reconstruction des solutions retenues.
+    """
+
+    _sets: Dict[int, Set[int]]
+
+    def _compute_reach(self) -> List[np.ndarray]:
+        """
+        Calcule les valeurs atteignables de chaque masque, une seule fois par multi-ensemble.
+
+        :return: La liste des tableaux de valeurs atteignables, indexée par masque.
+        """
+        self._sets = {}
+        reach: List[np.ndarray] = [np.empty(0, dtype=np.int64) for _ in range(self._full + 1)]
+        by_multiset: Dict[Tuple[int, ...], np.ndarray] = {}
+        for mask in range(1, self._full + 1):
+            key = self.multiset(mask)
+            values = by_multiset.get(key)
+            if values is None:
+                if len(key) == 1:
+                    values = np.array(key, dtype=np.int64)
+                else:
+                    combined = []
+                    for sub, other in self.splits(mask):
+                        if self._interrupted():
+                            break
+                        combined.append(combine(reach[sub], reach[other]))
+                    if self._stopped:
+                        # masque interrompu : ses valeurs sont incomplètes
+                        continue
+                    values = np.unique(np.concatenate(combined))
+                by_multiset[key] = values
+            reach[mask] = values
+        return reach
+
+    def array(self, mask: int) -> np.ndarray:
+        """
+        Retourne le tableau trié des valeurs atteignables avec les plaques d'un masque.
+
+        :param mask: Le masque du sous-ensemble.
+        """
+        return self._reach[mask]
+
+    def contains(self, mask: int, value: int) -> bool:
+        """
+        Indique si une valeur est atteignable avec les plaques d'un masque,
+        par recherche dichotomique dans le tableau trié.
+
+        :param mask: Le masque du sous-ensemble.
+        :param value: La valeur recherchée.
+        """
+        values = self._reach[mask]
+        index = int(np.searchsorted(values, value))
+        return index < len(values) and int(values[index]) == value
+
+    def reach(self, mask: int) -> Set[int]:
+        """
+        Retourne les valeurs atteignables avec les plaques d'un masque, converties
+        en ensemble à la première demande.
+
+        :param mask: Le masque du sous-ensemble.
+        """
+        values = self._sets.get(mask)
+        if values is None:
+            values = self._sets[mask] = set(self._reach[mask].tolist())
+        return values
+
+    def ecart(self, search: int) -> int:
+        """
+        Retourne le plus petit écart entre une valeur atteignable et la recherche.
+
+        :param search: La valeur recherchée.
+        """
+        return int(min(np.abs(values - search).min() for values in self._reach[1:] if len(values)))
@@ -38,26 +38,27 @@ class PyCeb:
         """
         Configure le tirage en fonction des arguments de la ligne de commande.
         """
-        if self.args.plaques:
-            # noinspection PyBroadException
-            try:
-                self.tirage.plaques = self.args.plaques
-            except:
-                print("Plaques invalide")
-                sys.exit(1)
-
-        if self.args.search != 0:
-            self.tirage.search = self.args.search
-
-        if len(self.args.integers) > 0:
-            if self.args.integers[0] > 100:
-                self.tirage.search = self.args.integers[0]
-                if len(self.args.integers) > 1:
-                    self.tirage.plaques = self.args.integers[1:7]
-            else:
-                self.tirage.plaques = self.args.integers[0:6]
-                if len(self.args.integers) > 6:
-                    self.tirage.search = self.args.integers[6]
+        with self.tirage.batch_update():
+            if self.args.plaques:
+                # noinspection PyBroadException
+                try:
+                    self.tirage.plaques = self.args.plaques
+                except:
+                    print("Plaques invalide")
+                    sys.exit(1)
+
+            if self.args.search != 0:
+                self.tirage.search = self.args.search
+
+            if len(self.args.integers) > 0:
+                if self.args.integers[0] > 100:
+                    self.tirage.search = self.args.integers[0]
+                    if len(self.args.integers) > 1:
+                        self.tirage.plaques = self.args.integers[1:7]
+                else:
+                    self.tirage.plaques = self.args.integers[0:6]
+                    if len(self.args.integers) > 6:
+                        self.tirage.search = self.args.integers[6]
 
     @ellapsed_exec
     def solve_tirage(self):
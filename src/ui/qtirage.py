@@ -38,7 +38,7 @@ class QTirage(CebTirage):
     def duree(self):
         return self._duree
 
-    def solve(self) -> CebStatus:
+    def solve(self, *args, **kwargs) -> CebStatus:
         """
         Executes the 'solve' method, measures its execution time, and notifies observers
         of the status.
@@ -55,7 +55,7 @@ class QTirage(CebTirage):
         QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
         timer = QElapsedTimer()
         timer.start()
-        status = super().solve()
+        status = super().solve(*args, **kwargs)
         self._duree = timer.elapsed()
         QApplication.restoreOverrideCursor()
         self._event.emit()